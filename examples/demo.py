@@ -86,12 +86,13 @@ def main() -> None:
     print("[*] Dice Rolling (100 rolls)")
     print("-" * 40)
     
-    # Roll a 6-sided die 100 times
-    rolls = [trueentropy.randint(1, 6) for _ in range(100)]
+    # Roll a 6-sided die 100 times (one batched draw from the pool)
+    rolls = trueentropy.randints(1, 6, 100)
     
-    # Count occurrences
-    from collections import Counter
-    counts = Counter(rolls)
+    # Count occurrences in a fixed-length list indexed by face
+    counts = [0] * 7
+    for roll in rolls:
+        counts[roll] += 1
     
     for face in range(1, 7):
         bar = "#" * (counts[face] // 2)
@@ -136,8 +137,9 @@ def main() -> None:
     
     # Generate a strong random password
     import string
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = "".join(trueentropy.choice(alphabet) for _ in range(16))
+    alphabet = (string.ascii_letters + string.digits + "!@#$%^&*").encode()
+    choice = trueentropy.choice  # Bind once instead of per character
+    password = bytes(choice(alphabet) for _ in range(16)).decode()
     print(f"  Random password:  {password}")
     
     # Generate a passphrase
@@ -155,9 +157,13 @@ def main() -> None:
     print("[*] Token Generator")
     print("-" * 40)
     
-    token = trueentropy.randbytes(16).hex()
-    formatted = f"{token[:8]}-{token[8:12]}-{token[12:16]}-{token[16:20]}-{token[20:]}"
-    print(f"  Random token:     {formatted}")
+    # Refill one buffer instead of allocating new bytes for every token
+    buf = bytearray(16)
+    for _ in range(3):
+        trueentropy.randbytes_into(buf)
+        token = buf.hex()
+        formatted = f"{token[:8]}-{token[8:12]}-{token[12:16]}-{token[16:20]}-{token[20:]}"
+        print(f"  Random token:     {formatted}")
     
     print()
     print("=" * 60)
@@ -37,6 +37,9 @@ latency, system state, and external APIs.
 
 from __future__ import annotations
 
+import threading
+import time
+
 # -----------------------------------------------------------------------------
 # Version Information
 # -----------------------------------------------------------------------------
@@ -77,13 +80,18 @@ T = TypeVar("T")
 # -----------------------------------------------------------------------------
 # We maintain a single global entropy pool and tap for convenience.
 # Users can also create their own instances if needed.
+#
+# Both are created on first use rather than at import time, so importing
+# the package (e.g. for type hints or __version__) does not seed a pool.
 
-_pool: EntropyPool = EntropyPool()
-# _tap is initialized with EntropyTap (DIRECT mode) by default
-_tap: BaseTap = EntropyTap(_pool)
+_pool: EntropyPool | None = None
+_tap: BaseTap | None = None
+_init_lock = threading.Lock()
 
-# Flag to track if background collector is running
-_collector_running: bool = False
+# health() reuses its last result for up to 100 ms while the pool and the
+# config are unchanged, so high-frequency polling doesn't recompute it
+_HEALTH_TTL_NS = 100_000_000
+_health_cache: tuple[tuple[Any, ...], HealthStatus] | None = None
 
 
 # -----------------------------------------------------------------------------
@@ -91,13 +99,55 @@ _collector_running: bool = False
 # -----------------------------------------------------------------------------
 
 
+def _get_pool() -> EntropyPool:
+    """Return the global pool, creating it on first use."""
+    pool = _pool
+    if pool is None:
+        pool = _initialize()[0]
+    return pool
+
+
+def _get_tap() -> BaseTap:
+    """Return the global tap, creating it (and the pool) on first use."""
+    tap = _tap
+    if tap is None:
+        tap = _initialize()[1]
+    return tap
+
+
+def _initialize() -> tuple[EntropyPool, BaseTap]:
+    """
+    Create the global pool and tap if they do not exist yet.
+
+    The tap type follows the current configuration, so a configure()
+    call made before first use is honored.
+
+    Returns:
+        The (pool, tap) pair
+    """
+    global _pool, _tap
+
+    with _init_lock:
+        if _pool is None:
+            _pool = EntropyPool()
+        if _tap is None:
+            _tap = EntropyTap(_pool)
+            _update_tap()
+        return _pool, _tap
+
+
 def _update_tap() -> None:
     """
     Update the global _tap instance based on current configuration.
 
-    Switches between EntropyTap (DIRECT) and HybridTap (HYBRID).
+    Switches between EntropyTap (DIRECT) and HybridTap (HYBRID). Does
+    nothing before first use; _initialize() applies the config then.
     """
     global _tap
+
+    if _pool is None or _tap is None:
+        return
+
     config = get_config()
 
     if config.mode == "HYBRID":
@@ -164,7 +214,8 @@ def configure(
     )
 
     # Update the active tap based on new config
-    _update_tap()
+    with _init_lock:
+        _update_tap()
 
     return cfg
 
@@ -189,7 +240,32 @@ def random() -> float:
         >>> print(f"Random value: {value}")
         Random value: 0.7234891623...
     """
-    return _tap.random()
+    return _get_tap().random()
+
+
+def randoms(n: int) -> list[float]:
+    """
+    Generate n random floating-point numbers in the range [0.0, 1.0).
+
+    Equivalent to calling random() n times, but draws the entropy for
+    the whole batch at once.
+
+    Args:
+        n: How many floats to generate
+
+    Returns:
+        A list of n random floats in [0.0, 1.0)
+
+    Raises:
+        ValueError: If n < 0
+
+    Example:
+        >>> import trueentropy
+        >>> samples = trueentropy.randoms(3)
+        >>> print(samples)
+        [0.4172839102..., 0.0923847561..., 0.8812093344...]
+    """
+    return _get_tap().randoms(n)
 
 
 def randint(a: int, b: int) -> int:
@@ -214,7 +290,34 @@ def randint(a: int, b: int) -> int:
         >>> print(f"Dice roll: {dice}")
         Dice roll: 4
     """
-    return _tap.randint(a, b)
+    return _get_tap().randint(a, b)
+
+
+def randints(a: int, b: int, n: int) -> list[int]:
+    """
+    Generate n random integers, each uniform in [a, b].
+
+    Equivalent to calling randint(a, b) n times, but draws the entropy
+    for the whole batch at once.
+
+    Args:
+        a: The lower bound (inclusive)
+        b: The upper bound (inclusive)
+        n: How many integers to generate
+
+    Returns:
+        A list of n random integers in [a, b]
+
+    Raises:
+        ValueError: If a > b or n < 0
+
+    Example:
+        >>> import trueentropy
+        >>> rolls = trueentropy.randints(1, 6, 10)
+        >>> print(rolls)
+        [4, 1, 6, 6, 2, 3, 5, 1, 2, 4]
+    """
+    return _get_tap().randints(a, b, n)
 
 
 def randbool() -> bool:
@@ -233,7 +336,7 @@ def randbool() -> bool:
         >>> print("Heads" if coin else "Tails")
         Heads
     """
-    return _tap.randbool()
+    return _get_tap().randbool()
 
 
 def choice(seq: Sequence[T]) -> T:
@@ -258,7 +361,7 @@ def choice(seq: Sequence[T]) -> T:
         >>> print(f"Selected: {color}")
         Selected: green
     """
-    return _tap.choice(seq)
+    return _get_tap().choice(seq)
 
 
 def randbytes(n: int) -> bytes:
@@ -269,13 +372,13 @@ def randbytes(n: int) -> bytes:
     Useful for generating cryptographic keys, tokens, or other binary data.
 
     Args:
-        n: The number of bytes to generate (must be positive)
+        n: The number of bytes to generate (must be non-negative)
 
     Returns:
         A bytes object of length n
 
     Raises:
-        ValueError: If n is not positive
+        ValueError: If n is negative
 
     Example:
         >>> import trueentropy
@@ -283,7 +386,33 @@ def randbytes(n: int) -> bytes:
         >>> print(f"Secret: {secret.hex()}")
         Secret: a1b2c3d4e5f6...
     """
-    return _tap.randbytes(n)
+    return _get_tap().randbytes(n)
+
+
+def randbytes_into(buffer: bytearray | memoryview) -> int:
+    """
+    Fill a writable buffer with random bytes.
+
+    Unlike randbytes(), no new bytes object is allocated: the output is
+    written in place, so one bytearray can be reused across calls.
+
+    Args:
+        buffer: A writable buffer such as a bytearray or memoryview
+
+    Returns:
+        The number of bytes written
+
+    Raises:
+        TypeError: If the buffer is read-only
+        ValueError: If the buffer is empty
+
+    Example:
+        >>> import trueentropy
+        >>> buf = bytearray(16)
+        >>> trueentropy.randbytes_into(buf)
+        16
+    """
+    return _get_tap().randbytes_into(buffer)
 
 
 def shuffle(seq: MutableSequence[Any]) -> None:
@@ -302,7 +431,7 @@ def shuffle(seq: MutableSequence[Any]) -> None:
         >>> print(cards[:5])
         [32, 7, 45, 12, 28]
     """
-    _tap.shuffle(seq)
+    _get_tap().shuffle(seq)
 
 
 def sample(seq: Sequence[T], k: int) -> list[T]:
@@ -327,7 +456,7 @@ def sample(seq: Sequence[T], k: int) -> list[T]:
         >>> print(f"Winning numbers: {lottery}")
         Winning numbers: [42, 7, 23, 56, 11, 39]
     """
-    return _tap.sample(seq, k)
+    return _get_tap().sample(seq, k)
 
 
 def uniform(a: float, b: float) -> float:
@@ -341,7 +470,7 @@ def uniform(a: float, b: float) -> float:
     Returns:
         Random float in [a, b]
     """
-    return _tap.uniform(a, b)
+    return _get_tap().uniform(a, b)
 
 
 def gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
@@ -355,7 +484,7 @@ def gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
     Returns:
         Random float from N(mu, sigma^2)
     """
-    return _tap.gauss(mu, sigma)
+    return _get_tap().gauss(mu, sigma)
 
 
 def triangular(low: float = 0.0, high: float = 1.0, mode: float | None = None) -> float:
@@ -370,7 +499,7 @@ def triangular(low: float = 0.0, high: float = 1.0, mode: float | None = None) -
     Returns:
         Random float from the triangular distribution
     """
-    return _tap.triangular(low, high, mode)
+    return _get_tap().triangular(low, high, mode)
 
 
 def exponential(lambd: float = 1.0) -> float:
@@ -383,7 +512,7 @@ def exponential(lambd: float = 1.0) -> float:
     Returns:
         Random float from Exp(lambda)
     """
-    return _tap.exponential(lambd)
+    return _get_tap().exponential(lambd)
 
 
 def weighted_choice(seq: Sequence[T], weights: Sequence[float]) -> T:
@@ -403,7 +532,7 @@ def weighted_choice(seq: Sequence[T], weights: Sequence[float]) -> T:
         >>> trueentropy.weighted_choice(['rare', 'common'], [1, 10])
         'common'  # Most likely
     """
-    return _tap.weighted_choice(seq, weights)
+    return _get_tap().weighted_choice(seq, weights)
 
 
 def random_uuid() -> str:
@@ -417,7 +546,7 @@ def random_uuid() -> str:
         >>> trueentropy.random_uuid()
         'f47ac10b-58cc-4372-a567-0e02b2c3d479'
     """
-    return _tap.random_uuid()
+    return _get_tap().random_uuid()
 
 
 def random_token(length: int = 32, encoding: str = "hex") -> str:
@@ -435,7 +564,7 @@ def random_token(length: int = 32, encoding: str = "hex") -> str:
         >>> trueentropy.random_token(16, 'hex')
         'a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6'
     """
-    return _tap.random_token(length, encoding)
+    return _get_tap().random_token(length, encoding)
 
 
 def random_password(
@@ -464,7 +593,7 @@ def random_password(
         >>> trueentropy.random_password(12)
         'Kx9#mP2$nL7@'
     """
-    return _tap.random_password(
+    return _get_tap().random_password(
         length, charset, include_uppercase, include_lowercase, include_digits, include_symbols
     )
 
@@ -484,6 +613,10 @@ def health() -> HealthStatus:
     - entropy_bits: Estimated bits of entropy in the pool
     - recommendation: Suggested action if health is low
 
+    Repeated calls within 100 ms reuse the previous evaluation unless the
+    pool has been fed or drained, or the configuration has changed, in the
+    meantime. Use trueentropy.health.entropy_health() for an uncached check.
+
     Returns:
         A HealthStatus TypedDict with pool health information
 
@@ -493,7 +626,28 @@ def health() -> HealthStatus:
         >>> print(f"Health: {status['score']}/100 ({status['status']})")
         Health: 85/100 (healthy)
     """
-    return entropy_health(_pool)
+    global _health_cache
+
+    pool = _get_pool()
+    key = (
+        time.monotonic_ns() // _HEALTH_TTL_NS,
+        pool,
+        get_config(),
+        pool.total_fed,
+        pool.total_extracted,
+    )
+
+    cached = _health_cache
+    if cached is not None and cached[0] == key:
+        status = cached[1]
+    else:
+        status = entropy_health(pool)
+        _health_cache = (key, status)
+
+    # Hand out a copy so callers can't modify the cached result
+    result = status.copy()
+    result["sources"] = {name: info.copy() for name, info in status["sources"].items()}
+    return result
 
 
 def feed(data: bytes) -> None:
@@ -513,7 +667,7 @@ def feed(data: bytes) -> None:
         >>> external_entropy = b'\\x12\\x34\\x56\\x78'
         >>> trueentropy.feed(external_entropy)
     """
-    _pool.feed(data)
+    _get_pool().feed(data)
 
 
 def start_collector(interval: float = 1.0) -> None:
@@ -533,15 +687,12 @@ def start_collector(interval: float = 1.0) -> None:
         >>> # ... application runs ...
         >>> trueentropy.stop_collector()
     """
-    global _collector_running
+    from trueentropy.collector import is_collector_running, start_background_collector
 
-    if _collector_running:
+    if is_collector_running():
         return  # Already running
 
-    from trueentropy.collector import start_background_collector
-
-    start_background_collector(_pool, interval)
-    _collector_running = True
+    start_background_collector(_get_pool(), interval)
 
 
 def stop_collector() -> None:
@@ -555,15 +706,11 @@ def stop_collector() -> None:
         >>> import trueentropy
         >>> trueentropy.stop_collector()
     """
-    global _collector_running
-
-    if not _collector_running:
-        return  # Not running
-
+    # The collector tracks its own thread, so this is a no-op when it is
+    # not running (including if it was started via trueentropy.collector)
     from trueentropy.collector import stop_background_collector
 
     stop_background_collector()
-    _collector_running = False
 
 
 # =============================================================================
@@ -581,7 +728,7 @@ def get_pool() -> EntropyPool:
     Returns:
         The global EntropyPool instance
     """
-    return _pool
+    return _get_pool()
 
 
 def get_tap() -> BaseTap:
@@ -594,7 +741,7 @@ def get_tap() -> BaseTap:
     Returns:
         The global BaseTap instance (EntropyTap or HybridTap)
     """
-    return _tap
+    return _get_tap()
 
 
 # =============================================================================
@@ -607,10 +754,13 @@ __all__ = [
     "__version__",
     # Random value generation
     "random",
+    "randoms",
     "randint",
+    "randints",
     "randbool",
     "choice",
     "randbytes",
+    "randbytes_into",
     "shuffle",
     "sample",
     # Distributions
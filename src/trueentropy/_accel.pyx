@@ -20,9 +20,10 @@ Or with pip:
     pip install -e ".[cython]"
 """
 
+from libc.stdint cimport uint32_t, uint64_t
 from libc.stdlib cimport malloc, free
 from libc.string cimport memcpy
-from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
 
 import struct
 
@@ -36,6 +37,8 @@ def xor_bytes_fast(bytes data, bytes key):
     Fast XOR of two byte strings using C-level operations.
     
     This is ~10-50x faster than the pure Python version for large inputs.
+    The data is processed one key-length chunk at a time, so the inner
+    loop has no per-byte modulo and compiles to vector XORs at -O3.
     
     Args:
         data: The data to XOR
@@ -47,10 +50,11 @@ def xor_bytes_fast(bytes data, bytes key):
     cdef:
         Py_ssize_t data_len = len(data)
         Py_ssize_t key_len = len(key)
-        unsigned char* result
+        bytes result
+        unsigned char* out
         const unsigned char* d = data
         const unsigned char* k = key
-        Py_ssize_t i
+        Py_ssize_t i, pos, chunk
     
     if data_len == 0:
         return b""
@@ -58,17 +62,18 @@ def xor_bytes_fast(bytes data, bytes key):
     if key_len == 0:
         return data
     
-    result = <unsigned char*>malloc(data_len)
-    if result == NULL:
-        raise MemoryError("Failed to allocate memory")
+    # Write straight into a fresh bytes object (no malloc + copy)
+    result = PyBytes_FromStringAndSize(NULL, data_len)
+    out = <unsigned char*>PyBytes_AS_STRING(result)
     
-    try:
-        for i in range(data_len):
-            result[i] = d[i] ^ k[i % key_len]
-        
-        return PyBytes_FromStringAndSize(<char*>result, data_len)
-    finally:
-        free(result)
+    pos = 0
+    while pos < data_len:
+        chunk = key_len if key_len < data_len - pos else data_len - pos
+        for i in range(chunk):
+            out[pos + i] = d[pos + i] ^ k[i]
+        pos += chunk
+    
+    return result
 
 
 def bytes_to_int_fast(bytes data):
@@ -220,6 +225,186 @@ def fisher_yates_indices(int n, random_func):
     return swaps
 
 
+# =============================================================================
+# Fast Shuffle and Sampling (pre-drawn entropy)
+# =============================================================================
+
+cdef inline uint32_t _load_u32(const unsigned char* p):
+    """Read a big-endian 32-bit word."""
+    return ((<uint32_t>p[0] << 24) | (<uint32_t>p[1] << 16)
+            | (<uint32_t>p[2] << 8) | <uint32_t>p[3])
+
+
+cdef inline Py_ssize_t _bounded(const unsigned char* p, uint64_t s, randbelow) except -1:
+    """
+    Map a 32-bit random word to [0, s) using Lemire's multiply-shift.
+
+    s may be anything in [1, 2^32]. The rare words that would introduce
+    bias are rejected and replaced by a call to randbelow(s), so the
+    result is exactly uniform.
+    """
+    cdef uint64_t m = <uint64_t>_load_u32(p) * s
+    cdef uint64_t low = m & 0xFFFFFFFFULL
+
+    if low < s and low < (0x100000000ULL - s) % s:
+        return randbelow(s)
+
+    return <Py_ssize_t>(m >> 32)
+
+
+def shuffle_fast(list seq, bytes rand, randbelow):
+    """
+    Fisher-Yates shuffle of a list in-place using pre-drawn entropy.
+
+    Args:
+        seq: The list to shuffle
+        rand: At least 4 * (len(seq) - 1) random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+    """
+    cdef:
+        Py_ssize_t n = len(seq)
+        Py_ssize_t i, j
+        const unsigned char* r = rand
+
+    if n < 2:
+        return
+
+    if len(rand) < 4 * (n - 1):
+        raise ValueError("rand must provide 4 bytes per swap")
+
+    for i in range(n - 1, 0, -1):
+        j = _bounded(r, <uint64_t>(i + 1), randbelow)
+        r += 4
+
+        if i != j:
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+def sample_indices_fast(Py_ssize_t n, Py_ssize_t k, bytes rand, randbelow):
+    """
+    Pick k distinct indices from range(n) using pre-drawn entropy.
+
+    Runs a partial Fisher-Yates shuffle over a C array of indices.
+
+    Args:
+        n: Population size
+        k: Number of indices to select (0 <= k <= n)
+        rand: At least 4 * k random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+
+    Returns:
+        List of k distinct indices in selection order
+    """
+    cdef:
+        Py_ssize_t* idx
+        Py_ssize_t i, j, tmp
+        const unsigned char* r = rand
+        list result = []
+
+    if len(rand) < 4 * k:
+        raise ValueError("rand must provide 4 bytes per selected index")
+
+    idx = <Py_ssize_t*>malloc(n * sizeof(Py_ssize_t))
+    if idx == NULL:
+        raise MemoryError("Failed to allocate memory")
+
+    try:
+        for i in range(n):
+            idx[i] = i
+
+        for i in range(k):
+            j = i + _bounded(r, <uint64_t>(n - i), randbelow)
+            r += 4
+
+            tmp = idx[i]
+            idx[i] = idx[j]
+            idx[j] = tmp
+
+            result.append(idx[i])
+
+        return result
+    finally:
+        free(idx)
+
+
+def floyd_sample_fast(Py_ssize_t n, Py_ssize_t k, bytes rand, randbelow):
+    """
+    Pick k distinct indices from range(n) using Floyd's algorithm.
+
+    Uses O(k) memory instead of an n-element index array, then shuffles
+    the picks so the selection order is uniformly random too.
+
+    Args:
+        n: Population size
+        k: Number of indices to select (0 <= k <= n)
+        rand: At least 4 * (2 * k - 1) random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+
+    Returns:
+        List of k distinct indices in selection order
+    """
+    cdef:
+        Py_ssize_t i, j, t
+        const unsigned char* r = rand
+        set selected = set()
+        list result = []
+
+    if k == 0:
+        return result
+
+    if len(rand) < 4 * (2 * k - 1):
+        raise ValueError("rand must provide 8 bytes per selected index")
+
+    for j in range(n - k, n):
+        t = _bounded(r, <uint64_t>(j + 1), randbelow)
+        r += 4
+
+        if t in selected:
+            t = j
+
+        selected.add(t)
+        result.append(t)
+
+    # Floyd picks a uniform subset but not a uniform order
+    for i in range(k - 1, 0, -1):
+        j = _bounded(r, <uint64_t>(i + 1), randbelow)
+        r += 4
+
+        if i != j:
+            result[i], result[j] = result[j], result[i]
+
+    return result
+
+
+def bounded_ints_fast(a, uint64_t s, Py_ssize_t count, bytes rand, randbelow):
+    """
+    Generate count uniform integers in [a, a + s) from pre-drawn entropy.
+
+    Args:
+        a: Lower bound (inclusive)
+        s: Range size, 1 <= s <= 2^32
+        count: Number of integers to generate
+        rand: At least 4 * count random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+
+    Returns:
+        List of count integers
+    """
+    cdef:
+        Py_ssize_t i
+        const unsigned char* r = rand
+        list result = []
+
+    if len(rand) < 4 * count:
+        raise ValueError("rand must provide 4 bytes per integer")
+
+    for i in range(count):
+        result.append(a + _bounded(r, s, randbelow))
+        r += 4
+
+    return result
+
+
 # =============================================================================
 # Module Info
 # =============================================================================
@@ -23,15 +23,35 @@ when available and falling back to pure Python otherwise.
 
 from __future__ import annotations
 
+import struct
+from collections.abc import Callable, MutableSequence
+from typing import Any
+
+# Random bytes consumed per index by shuffle_in_place() and sample_indices().
+# Indices are drawn from 32-bit words, so sequences up to 2^32 are supported.
+BYTES_PER_INDEX = 4
+MAX_INDEX_RANGE = 1 << 32
+
+# sample_indices() switches from a partial Fisher-Yates shuffle over all n
+# indices to Floyd's O(k) algorithm once n exceeds this multiple of k
+SPARSE_SAMPLE_FACTOR = 10
+
+# Scale factor for _uniform_float_python() (2^-64 is exact in a double)
+_INV_2_64 = 1.0 / (1 << 64)
+
 # Try to import Cython-accelerated functions
 _USE_CYTHON = False
 
 try:
     from trueentropy._accel import (
+        bounded_ints_fast,
         bytes_to_int_fast,
         fisher_yates_indices,
+        floyd_sample_fast,
         int_to_bytes_fast,
+        sample_indices_fast,
         scale_to_range_fast,
+        shuffle_fast,
         uniform_float_fast,
         xor_bytes_fast,
     )
@@ -51,13 +71,13 @@ def _xor_bytes_python(data: bytes, key: bytes) -> bytes:
     if not data or not key:
         return data
 
-    result = bytearray(len(data))
-    key_len = len(key)
+    # Repeat the key to cover the data, then XOR both as big integers so
+    # the work happens in C instead of a per-byte interpreter loop
+    n = len(data)
+    stream = (key * -(-n // len(key)))[:n]
+    mixed = int.from_bytes(data, "big") ^ int.from_bytes(stream, "big")
 
-    for i, b in enumerate(data):
-        result[i] = b ^ key[i % key_len]
-
-    return bytes(result)
+    return mixed.to_bytes(n, "big")
 
 
 def _bytes_to_int_python(data: bytes) -> int:
@@ -92,7 +112,7 @@ def _scale_to_range_python(value: int, a: int, b: int) -> tuple:
 
 def _uniform_float_python(value: int) -> float:
     """Pure Python uniform float."""
-    return value / 18446744073709551616.0
+    return value * _INV_2_64
 
 
 def _fisher_yates_indices_python(n: int, random_func) -> list:
@@ -105,6 +125,79 @@ def _fisher_yates_indices_python(n: int, random_func) -> list:
     return swaps
 
 
+def _bounded_python(word: int, s: int, randbelow: Callable[[int], int]) -> int:
+    """Pure Python Lemire multiply-shift of a 32-bit word into [0, s)."""
+    m = word * s
+    low = m & 0xFFFFFFFF
+
+    # Reject the few words that would bias the result
+    if low < s and low < (MAX_INDEX_RANGE - s) % s:
+        return randbelow(s)
+
+    return m >> 32
+
+
+def _shuffle_python(
+    seq: MutableSequence[Any], rand: bytes, randbelow: Callable[[int], int]
+) -> None:
+    """Pure Python Fisher-Yates shuffle driven by pre-drawn entropy."""
+    n = len(seq)
+    if n < 2:
+        return
+
+    words = struct.unpack(f">{n - 1}I", rand[: BYTES_PER_INDEX * (n - 1)])
+
+    for i, word in zip(range(n - 1, 0, -1), words):
+        j = _bounded_python(word, i + 1, randbelow)
+        if i != j:
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+def _sample_indices_python(
+    n: int, k: int, rand: bytes, randbelow: Callable[[int], int]
+) -> list[int]:
+    """Pure Python partial Fisher-Yates selection of k indices."""
+    words = struct.unpack(f">{k}I", rand[: BYTES_PER_INDEX * k])
+    pool = list(range(n))
+    result = []
+
+    for i, word in enumerate(words):
+        j = i + _bounded_python(word, n - i, randbelow)
+        pool[i], pool[j] = pool[j], pool[i]
+        result.append(pool[i])
+
+    return result
+
+
+def _floyd_sample_python(n: int, k: int, rand: bytes, randbelow: Callable[[int], int]) -> list[int]:
+    """Pure Python Floyd selection of k indices, shuffled into random order."""
+    if k == 0:
+        return []
+
+    words = struct.unpack(f">{k}I", rand[: BYTES_PER_INDEX * k])
+    selected: set[int] = set()
+    result = []
+
+    for j, word in zip(range(n - k, n), words):
+        t = _bounded_python(word, j + 1, randbelow)
+        if t in selected:
+            t = j
+        selected.add(t)
+        result.append(t)
+
+    # Floyd picks a uniform subset but not a uniform order
+    _shuffle_python(result, rand[BYTES_PER_INDEX * k :], randbelow)
+    return result
+
+
+def _bounded_ints_python(
+    a: int, s: int, count: int, rand: bytes, randbelow: Callable[[int], int]
+) -> list[int]:
+    """Pure Python batch of uniform integers in [a, a + s)."""
+    words = struct.unpack(f">{count}I", rand[: BYTES_PER_INDEX * count])
+    return [a + _bounded_python(word, s, randbelow) for word in words]
+
+
 # =============================================================================
 # Public API - Auto-selects best implementation
 # =============================================================================
@@ -207,6 +300,91 @@ def get_fisher_yates_indices(n: int, random_func) -> list:
     return _fisher_yates_indices_python(n, random_func)
 
 
+def shuffle_in_place(
+    seq: MutableSequence[Any], rand: bytes, randbelow: Callable[[int], int]
+) -> None:
+    """
+    Fisher-Yates shuffle a sequence in-place using pre-drawn entropy.
+
+    Each swap index is derived from a 32-bit word of rand, so a caller
+    can draw all the entropy for the shuffle in one pool extraction.
+
+    Args:
+        seq: Mutable sequence to shuffle (lists use the Cython kernel)
+        rand: At least BYTES_PER_INDEX * (len(seq) - 1) random bytes
+        randbelow: Function(n) -> uniform int in [0, n), called only for
+                   the rare words rejected to avoid bias
+    """
+    if _USE_CYTHON and type(seq) is list:
+        shuffle_fast(seq, rand, randbelow)
+    else:
+        _shuffle_python(seq, rand, randbelow)
+
+
+def sample_entropy_size(n: int, k: int) -> int:
+    """
+    Number of random bytes sample_indices(n, k, ...) consumes.
+
+    Args:
+        n: Population size
+        k: Number of indices to select
+
+    Returns:
+        Byte count to draw before calling sample_indices()
+    """
+    if n > SPARSE_SAMPLE_FACTOR * k:
+        # Floyd's selection plus a shuffle of the k picks
+        return BYTES_PER_INDEX * max(0, 2 * k - 1)
+    return BYTES_PER_INDEX * k
+
+
+def sample_indices(n: int, k: int, rand: bytes, randbelow: Callable[[int], int]) -> list[int]:
+    """
+    Select k distinct indices from range(n) using pre-drawn entropy.
+
+    Small samples from large populations use Floyd's algorithm, which
+    needs O(k) memory; otherwise a partial Fisher-Yates shuffle is run.
+
+    Args:
+        n: Population size (at most MAX_INDEX_RANGE)
+        k: Number of indices to select (0 <= k <= n)
+        rand: At least sample_entropy_size(n, k) random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+
+    Returns:
+        List of k distinct indices in selection order
+    """
+    if n > SPARSE_SAMPLE_FACTOR * k:
+        if _USE_CYTHON:
+            return floyd_sample_fast(n, k, rand, randbelow)
+        return _floyd_sample_python(n, k, rand, randbelow)
+
+    if _USE_CYTHON:
+        return sample_indices_fast(n, k, rand, randbelow)
+    return _sample_indices_python(n, k, rand, randbelow)
+
+
+def bounded_ints(
+    a: int, s: int, count: int, rand: bytes, randbelow: Callable[[int], int]
+) -> list[int]:
+    """
+    Generate count uniform integers in [a, a + s) from pre-drawn entropy.
+
+    Args:
+        a: Lower bound (inclusive)
+        s: Range size (1 <= s <= MAX_INDEX_RANGE)
+        count: Number of integers to generate
+        rand: At least BYTES_PER_INDEX * count random bytes
+        randbelow: Function(n) -> uniform int in [0, n), used on rejection
+
+    Returns:
+        List of count integers
+    """
+    if _USE_CYTHON:
+        return bounded_ints_fast(a, s, count, rand, randbelow)
+    return _bounded_ints_python(a, s, count, rand, randbelow)
+
+
 def is_accelerated() -> bool:
     """
     Check if Cython acceleration is active.
@@ -238,6 +416,12 @@ __all__ = [
     "scale_to_range",
     "uniform_float",
     "get_fisher_yates_indices",
+    "shuffle_in_place",
+    "sample_indices",
+    "sample_entropy_size",
+    "bounded_ints",
+    "BYTES_PER_INDEX",
+    "MAX_INDEX_RANGE",
     "is_accelerated",
     "get_backend",
 ]
@@ -32,9 +32,10 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from trueentropy.config import TrueEntropyConfig, get_config
-from trueentropy.harvesters.base import BaseHarvester
+from trueentropy.config import NETWORK_SOURCES, TrueEntropyConfig, get_config
+from trueentropy.harvesters.base import BaseHarvester, HarvestResult
 from trueentropy.harvesters.external import ExternalHarvester
 from trueentropy.harvesters.network import NetworkHarvester
 from trueentropy.harvesters.radioactive import RadioactiveHarvester
@@ -60,6 +61,10 @@ _collector_thread: threading.Thread | None = None
 # Event to signal the collector to stop
 _stop_event: threading.Event | None = None
 
+# Serializes start/stop so concurrent calls can't start two collectors
+# or tear down a thread that is still being started
+_state_lock = threading.Lock()
+
 
 # -----------------------------------------------------------------------------
 # Public Functions
@@ -95,56 +100,61 @@ def start_background_collector(
     """
     global _collector_thread, _stop_event
 
-    # Check if already running
-    if _collector_thread is not None and _collector_thread.is_alive():
-        logger.warning("Background collector is already running")
-        return
-
-    # Use provided config or global config
-    cfg = config or get_config()
-
-    # Create stop event
-    _stop_event = threading.Event()
-
-    # Create harvesters based on configuration
-    harvesters: list[BaseHarvester] = []
-
-    # Offline sources (always process if enabled)
-    if cfg.enable_timing:
-        harvesters.append(TimingHarvester())
-    if cfg.enable_system:
-        harvesters.append(SystemHarvester())
-
-    # Network-dependent sources
-    if cfg.enable_network:
-        harvesters.append(NetworkHarvester())
-    if cfg.enable_external:
-        harvesters.append(ExternalHarvester())
-    if cfg.enable_weather:
-        harvesters.append(WeatherHarvester())
-    if cfg.enable_radioactive:
-        harvesters.append(RadioactiveHarvester())
-
-    if not harvesters:
-        logger.warning("No harvesters enabled in configuration")
-        return
-
-    # Create collector thread
-    _collector_thread = threading.Thread(
-        target=_collector_loop,
-        args=(pool, harvesters, interval, _stop_event),
-        name="TrueEntropy-Collector",
-        daemon=True,  # Allows clean exit when main program ends
-    )
+    with _state_lock:
+        # Check if already running
+        if _collector_thread is not None and _collector_thread.is_alive():
+            logger.warning("Background collector is already running")
+            return
+
+        # Use provided config or global config
+        cfg = config or get_config()
+
+        # Create stop event
+        _stop_event = threading.Event()
+
+        # Create harvesters based on configuration
+        harvesters: list[BaseHarvester] = []
+
+        # Offline sources (always process if enabled)
+        if cfg.enable_timing:
+            harvesters.append(TimingHarvester())
+        if cfg.enable_system:
+            harvesters.append(SystemHarvester())
+
+        # Network-dependent sources
+        if cfg.enable_network:
+            harvesters.append(NetworkHarvester())
+        if cfg.enable_external:
+            harvesters.append(ExternalHarvester())
+        if cfg.enable_weather:
+            harvesters.append(WeatherHarvester())
+        if cfg.enable_radioactive:
+            harvesters.append(RadioactiveHarvester())
+
+        if not harvesters:
+            logger.warning("No harvesters enabled in configuration")
+            return
+
+        # Network-bound harvesters run concurrently on a small pool of
+        # worker threads owned by (and shut down with) the collector loop
+        executor = _make_executor(harvesters)
+
+        # Create collector thread
+        _collector_thread = threading.Thread(
+            target=_collector_loop,
+            args=(pool, harvesters, interval, _stop_event, executor),
+            name="TrueEntropy-Collector",
+            daemon=True,  # Allows clean exit when main program ends
+        )
 
-    # Start the thread
-    _collector_thread.start()
+        # Start the thread
+        _collector_thread.start()
 
-    mode = "OFFLINE" if cfg.offline_mode else "ONLINE"
-    logger.info(
-        f"Background collector started ({mode}) with {len(harvesters)} harvesters, "
-        f"interval={interval}s"
-    )
+        mode = "OFFLINE" if cfg.offline_mode else "ONLINE"
+        logger.info(
+            f"Background collector started ({mode}) with {len(harvesters)} harvesters, "
+            f"interval={interval}s"
+        )
 
 
 def stop_background_collector(timeout: float = 5.0) -> bool:
@@ -166,32 +176,33 @@ def stop_background_collector(timeout: float = 5.0) -> bool:
     """
     global _collector_thread, _stop_event
 
-    if _collector_thread is None or not _collector_thread.is_alive():
-        logger.debug("Background collector is not running")
-        return True
+    with _state_lock:
+        if _collector_thread is None or not _collector_thread.is_alive():
+            logger.debug("Background collector is not running")
+            return True
 
-    if _stop_event is None:
-        logger.error("Stop event is None but thread is running")
-        return False
+        if _stop_event is None:
+            logger.error("Stop event is None but thread is running")
+            return False
 
-    # Signal the collector to stop
-    _stop_event.set()
-    logger.debug("Stop signal sent to collector")
+        # Signal the collector to stop
+        _stop_event.set()
+        logger.debug("Stop signal sent to collector")
 
-    # Wait for thread to finish
-    _collector_thread.join(timeout=timeout)
+        # Wait for thread to finish
+        _collector_thread.join(timeout=timeout)
 
-    if _collector_thread.is_alive():
-        logger.warning(f"Collector did not stop within {timeout}s")
-        return False
+        if _collector_thread.is_alive():
+            logger.warning(f"Collector did not stop within {timeout}s")
+            return False
 
-    logger.info("Background collector stopped")
+        logger.info("Background collector stopped")
 
-    # Clean up
-    _collector_thread = None
-    _stop_event = None
+        # Clean up
+        _collector_thread = None
+        _stop_event = None
 
-    return True
+        return True
 
 
 def is_collector_running() -> bool:
@@ -209,8 +220,62 @@ def is_collector_running() -> bool:
 # -----------------------------------------------------------------------------
 
 
+def _make_executor(harvesters: list[BaseHarvester]) -> ThreadPoolExecutor | None:
+    """
+    Create a worker pool for the network-bound harvesters, if there are any.
+
+    Args:
+        harvesters: The harvesters a collection cycle will run
+
+    Returns:
+        An executor with one worker per network harvester, or None
+    """
+    num_network = sum(1 for harvester in harvesters if harvester.name in NETWORK_SOURCES)
+    if num_network == 0:
+        return None
+
+    return ThreadPoolExecutor(max_workers=num_network, thread_name_prefix="TrueEntropy-Harvester")
+
+
+def _harvest(
+    harvesters: list[BaseHarvester], executor: ThreadPoolExecutor | None
+) -> list[HarvestResult]:
+    """
+    Run every harvester once.
+
+    Network-bound harvesters are submitted to the executor so a cycle
+    takes as long as the slowest request rather than the sum of all of
+    them; offline harvesters run inline in the meantime.
+
+    Args:
+        harvesters: The harvesters to run
+        executor: Worker pool for network harvesters (None runs all inline)
+
+    Returns:
+        One result per harvester, in harvester order
+    """
+    futures: dict[int, Future[HarvestResult]] = {}
+
+    if executor is not None:
+        for i, harvester in enumerate(harvesters):
+            if harvester.name in NETWORK_SOURCES:
+                # safe_collect never raises, so result() below won't either
+                futures[i] = executor.submit(harvester.safe_collect)
+
+    results: list[HarvestResult] = []
+    for i, harvester in enumerate(harvesters):
+        future = futures.get(i)
+        results.append(future.result() if future is not None else harvester.safe_collect())
+
+    return results
+
+
 def _collector_loop(
-    pool: EntropyPool, harvesters: list[BaseHarvester], interval: float, stop_event: threading.Event
+    pool: EntropyPool,
+    harvesters: list[BaseHarvester],
+    interval: float,
+    stop_event: threading.Event,
+    executor: ThreadPoolExecutor | None = None,
 ) -> None:
     """
     Main loop for the background collector thread.
@@ -223,43 +288,47 @@ def _collector_loop(
         harvesters: List of harvesters to use
         interval: Seconds between collection cycles
         stop_event: Event to signal when to stop
+        executor: Worker pool for network harvesters; shut down on exit
     """
     logger.debug("Collector loop started")
 
-    while not stop_event.is_set():
-        # Track timing for this cycle
-        cycle_start = time.perf_counter()
-
-        # Collect from all harvesters
-        total_bits = 0
-        successful = 0
-
-        for harvester in harvesters:
-            # Use safe_collect to handle any exceptions
-            result = harvester.safe_collect()
-
-            if result.success:
-                # Feed the collected entropy into the pool
-                pool.feed(result.data, entropy_estimate=result.entropy_bits)
-                total_bits += result.entropy_bits
-                successful += 1
-                logger.debug(
-                    f"Harvester '{result.source}' collected " f"{result.entropy_bits} bits"
-                )
-            else:
-                logger.debug(f"Harvester '{result.source}' failed: {result.error}")
-
-        # Log cycle summary
-        cycle_time = time.perf_counter() - cycle_start
-        logger.debug(
-            f"Collection cycle complete: {successful}/{len(harvesters)} "
-            f"harvesters, {total_bits} bits, {cycle_time:.3f}s"
-        )
-
-        # Wait for the next cycle (or until stop is signaled)
-        # We use wait() instead of sleep() so we can respond to stop quickly
-        remaining_interval = max(0, interval - cycle_time)
-        stop_event.wait(timeout=remaining_interval)
+    try:
+        while not stop_event.is_set():
+            # Track timing for this cycle
+            cycle_start = time.perf_counter()
+
+            # Collect from all harvesters
+            samples: list[bytes] = []
+            total_bits = 0
+
+            for result in _harvest(harvesters, executor):
+                if result.success:
+                    samples.append(result.data)
+                    total_bits += result.entropy_bits
+                    logger.debug(
+                        f"Harvester '{result.source}' collected " f"{result.entropy_bits} bits"
+                    )
+                else:
+                    logger.debug(f"Harvester '{result.source}' failed: {result.error}")
+
+            # Mix the whole cycle into the pool in a single step
+            pool.feed_batch(samples, entropy_estimate=total_bits)
+            successful = len(samples)
+
+            # Log cycle summary
+            cycle_time = time.perf_counter() - cycle_start
+            logger.debug(
+                f"Collection cycle complete: {successful}/{len(harvesters)} "
+                f"harvesters, {total_bits} bits, {cycle_time:.3f}s"
+            )
+
+            # Wait for the next cycle (or until stop is signaled)
+            # We use wait() instead of sleep() so we can respond to stop quickly
+            remaining_interval = max(0, interval - cycle_time)
+            stop_event.wait(timeout=remaining_interval)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     logger.debug("Collector loop exiting")
 
@@ -295,13 +364,21 @@ def collect_once(pool: EntropyPool, config: TrueEntropyConfig | None = None) ->
     if cfg.enable_radioactive:
         harvesters.append(RadioactiveHarvester())
 
+    samples: list[bytes] = []
     total_bits = 0
 
-    for harvester in harvesters:
-        result = harvester.safe_collect()
+    executor = _make_executor(harvesters)
+    try:
+        results = _harvest(harvesters, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
+    for result in results:
         if result.success:
-            pool.feed(result.data, entropy_estimate=result.entropy_bits)
+            samples.append(result.data)
             total_bits += result.entropy_bits
 
+    pool.feed_batch(samples, entropy_estimate=total_bits)
+
     return total_bits
@@ -26,8 +26,10 @@ sources and support offline mode operation.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any, ClassVar, Literal
 
 # -----------------------------------------------------------------------------
 # Source Metadata
@@ -44,7 +46,7 @@ ALL_SOURCES = OFFLINE_SOURCES | NETWORK_SOURCES
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class TrueEntropyConfig:
     """
     Configuration for TrueEntropy entropy collection.
@@ -53,6 +55,10 @@ class TrueEntropyConfig:
     Users can enable/disable individual harvesters or use offline_mode
     to disable all network-dependent sources at once.
 
+    Instances are immutable: configure() replaces the global config
+    instead of modifying it, so the derived source sets are computed
+    once at construction.
+
     Attributes:
         enable_timing: Enable CPU timing jitter harvester (offline)
         enable_system: Enable system state harvester (offline)
@@ -82,10 +88,31 @@ class TrueEntropyConfig:
     enable_weather: bool = True
     enable_radioactive: bool = True
 
+    # Source name -> (flag getter, requires network)
+    _SOURCE_INFO: ClassVar[dict[str, tuple[Callable[[Any], bool], bool]]] = {
+        "timing": (attrgetter("enable_timing"), False),
+        "system": (attrgetter("enable_system"), False),
+        "network": (attrgetter("enable_network"), True),
+        "external": (attrgetter("enable_external"), True),
+        "weather": (attrgetter("enable_weather"), True),
+        "radioactive": (attrgetter("enable_radioactive"), True),
+    }
+
+    # Derived source sets, computed in __post_init__
+    _enabled: frozenset[str] = field(init=False, repr=False, compare=False)
+    _disabled: frozenset[str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
+        """Validate configuration and cache the derived source sets."""
+        enabled = frozenset(
+            source for source, (is_enabled, _) in self._SOURCE_INFO.items() if is_enabled(self)
+        )
+        # The dataclass is frozen, so the caches bypass __setattr__
+        object.__setattr__(self, "_enabled", enabled)
+        object.__setattr__(self, "_disabled", ALL_SOURCES - enabled)
+
         # Ensure at least one source is enabled (if in DIRECT mode or collecting)
-        if not any(self.enabled_sources):
+        if not enabled:
             # In HYBRID mode, we technically need sources too for reseeding,
             # but we could rely on os.urandom initial seed if desperate.
             # For now, strict validation is safer.
@@ -107,47 +134,27 @@ class TrueEntropyConfig:
 
         Returns True if all network-dependent sources are disabled.
         """
-        return not any(
-            [
-                self.enable_network,
-                self.enable_external,
-                self.enable_weather,
-                self.enable_radioactive,
-            ]
-        )
+        return self._enabled.isdisjoint(NETWORK_SOURCES)
 
     @property
-    def enabled_sources(self) -> set[str]:
+    def enabled_sources(self) -> frozenset[str]:
         """
         Get the set of currently enabled source names.
 
         Returns:
             Set of enabled source names (e.g., {"timing", "system"})
         """
-        sources = set()
-        if self.enable_timing:
-            sources.add("timing")
-        if self.enable_system:
-            sources.add("system")
-        if self.enable_network:
-            sources.add("network")
-        if self.enable_external:
-            sources.add("external")
-        if self.enable_weather:
-            sources.add("weather")
-        if self.enable_radioactive:
-            sources.add("radioactive")
-        return sources
+        return self._enabled
 
     @property
-    def disabled_sources(self) -> set[str]:
+    def disabled_sources(self) -> frozenset[str]:
         """
         Get the set of currently disabled source names.
 
         Returns:
             Set of disabled source names
         """
-        return set(ALL_SOURCES - self.enabled_sources)
+        return self._disabled
 
     # -------------------------------------------------------------------------
     # Methods
@@ -163,19 +170,12 @@ class TrueEntropyConfig:
         Returns:
             Dict with 'enabled' and 'requires_network' keys
         """
-        enabled_map = {
-            "timing": self.enable_timing,
-            "system": self.enable_system,
-            "network": self.enable_network,
-            "external": self.enable_external,
-            "weather": self.enable_weather,
-            "radioactive": self.enable_radioactive,
-        }
-
-        return {
-            "enabled": enabled_map.get(source, False),
-            "requires_network": source in NETWORK_SOURCES,
-        }
+        info = self._SOURCE_INFO.get(source)
+        if info is None:
+            return {"enabled": False, "requires_network": False}
+
+        is_enabled, requires_network = info
+        return {"enabled": is_enabled(self), "requires_network": requires_network}
 
     def copy(self, **changes: Any) -> TrueEntropyConfig:
         """
@@ -187,9 +187,8 @@ class TrueEntropyConfig:
         Returns:
             New TrueEntropyConfig instance
         """
-        from dataclasses import asdict
-
-        current = asdict(self)
+        # Only constructor fields: the derived source sets are recomputed
+        current = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
         current.update(changes)
         return TrueEntropyConfig(**current)
 
@@ -22,10 +22,11 @@ and suggest improvements when entropy levels are low.
 
 from __future__ import annotations
 
+import math
 import time
 from typing import Literal, TypedDict
 
-from trueentropy.config import get_config
+from trueentropy.config import TrueEntropyConfig, get_config
 from trueentropy.pool import EntropyPool
 
 # -----------------------------------------------------------------------------
@@ -71,6 +72,35 @@ class HealthStatus(TypedDict):
     offline_mode: bool
 
 
+# -----------------------------------------------------------------------------
+# Source Status Cache
+# -----------------------------------------------------------------------------
+
+# Display order of the sources in health reports
+_SOURCE_ORDER = ("timing", "system", "network", "external", "weather", "radioactive")
+
+# Configs are immutable, so the per-source flags only change when
+# configure() installs a new config object
+_source_flags_cache: tuple[TrueEntropyConfig, tuple[tuple[str, bool, bool], ...]] | None = None
+
+
+def _source_flags(config: TrueEntropyConfig) -> tuple[tuple[str, bool, bool], ...]:
+    """Return (name, enabled, requires_network) for each source of config."""
+    global _source_flags_cache
+
+    cached = _source_flags_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    flags = []
+    for name in _SOURCE_ORDER:
+        info = config.get_source_info(name)
+        flags.append((name, info["enabled"], info["requires_network"]))
+
+    _source_flags_cache = (config, tuple(flags))
+    return _source_flags_cache[1]
+
+
 # -----------------------------------------------------------------------------
 # Health Check Function
 # -----------------------------------------------------------------------------
@@ -136,8 +166,6 @@ def entropy_health(pool: EntropyPool) -> HealthStatus:
     #   - 30 seconds: ~37
     #   - 60 seconds: ~14
     #   - 120 seconds: ~2
-    import math
-
     freshness_score = int(100 * math.exp(-time_since_feed / 30))
     freshness_score = max(0, min(100, freshness_score))
 
@@ -194,15 +222,13 @@ def entropy_health(pool: EntropyPool) -> HealthStatus:
     # Build Sources Status
     # -------------------------------------------------------------------------
 
+    # Each call returns fresh dicts (callers may modify them); only the
+    # flags are reused while the config is unchanged
     config = get_config()
-    sources: dict[str, SourceStatus] = {}
-
-    for source_name in ["timing", "system", "network", "external", "weather", "radioactive"]:
-        info = config.get_source_info(source_name)
-        sources[source_name] = SourceStatus(
-            enabled=info["enabled"],
-            requires_network=info["requires_network"],
-        )
+    sources: dict[str, SourceStatus] = {
+        name: {"enabled": enabled, "requires_network": requires_network}
+        for name, enabled, requires_network in _source_flags(config)
+    }
 
     # -------------------------------------------------------------------------
     # Build and Return Result
@@ -38,6 +38,7 @@ import time
 from pathlib import Path
 from typing import BinaryIO, Union
 
+from trueentropy.accel import xor_bytes
 from trueentropy.pool import EntropyPool
 
 # Type alias for path-like objects
@@ -230,7 +231,7 @@ def _write_pool_state(f: BinaryIO, state_data: dict, include_checksum: bool) ->
 
     # State data (XOR obfuscated with timestamp-derived key)
     key = _derive_key(timestamp)
-    obfuscated = _xor_bytes(state, key)
+    obfuscated = xor_bytes(state, key)
     f.write(obfuscated)
 
     # Optional checksum (32 bytes SHA-256)
@@ -269,7 +270,7 @@ def _read_pool_state(f: BinaryIO, verify_checksum: bool) -> dict:
 
     # De-obfuscate
     key = _derive_key(timestamp)
-    state = _xor_bytes(obfuscated, key)
+    state = xor_bytes(obfuscated, key)
 
     # Optional checksum
     if verify_checksum:
@@ -294,14 +295,6 @@ def _derive_key(timestamp: float) -> bytes:
     return hashlib.sha256(ts_bytes).digest() * 16  # 512 bytes
 
 
-def _xor_bytes(data: bytes, key: bytes) -> bytes:
-    """XOR data with key (key is repeated as needed)."""
-    result = bytearray(len(data))
-    for i, b in enumerate(data):
-        result[i] = b ^ key[i % len(key)]
-    return bytes(result)
-
-
 # =============================================================================
 # Module Exports
 # =============================================================================
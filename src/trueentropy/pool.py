@@ -11,7 +11,8 @@
 # 2. New entropy is fed into the pool via the feed() method
 # 3. Each feed operation mixes the new data with existing pool state
 #    using SHA-256 hashing (whitening)
-# 4. The extract() method pulls entropy out of the pool
+# 4. The extract() method pulls entropy out of the pool: a SHA-256 key is
+#    derived from the pool state and expanded with SHAKE-256
 # 5. After extraction, the pool state is updated to prevent reuse
 #
 # Security Properties:
@@ -36,6 +37,7 @@ import os
 import struct
 import threading
 import time
+from collections.abc import Sequence
 
 
 class EntropyPool:
@@ -74,6 +76,17 @@ class EntropyPool:
     # Hash output size (SHA-256 = 32 bytes)
     HASH_SIZE: int = 32
 
+    # Bytes of OS entropy used for the default initial seed (512 bits)
+    # The seed is expanded through SHA-256, so more than this adds no
+    # strength, only hashing work at construction
+    SEED_SIZE: int = 64
+
+    # Counter suffixes for the counter-mode state expansion, packed once
+    # instead of on every feed/extract
+    _EXPAND_COUNTERS: tuple[bytes, ...] = tuple(
+        struct.pack("!Q", counter) for counter in range(-(-POOL_SIZE // HASH_SIZE))
+    )
+
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
@@ -89,10 +102,10 @@ class EntropyPool:
         # Initialize the pool with random data
         # We use os.urandom() as the initial seed because it provides
         # cryptographically secure random bytes from the OS
-        initial = seed if seed is not None else os.urandom(self.POOL_SIZE)
+        initial = seed if seed is not None else os.urandom(self.SEED_SIZE)
 
         # Expand seed to full pool size if needed
-        self._pool: bytes = self._expand_to_pool_size(initial)
+        self._set_state(self._expand_to_pool_size(initial))
 
         # Track estimated entropy bits in the pool
         # This is a conservative estimate based on input sources
@@ -112,6 +125,10 @@ class EntropyPool:
         # Counter for total bytes extracted from the pool
         self._total_extracted: int = 0
 
+        # Bumped whenever outside data changes the state (feed, reseed,
+        # restore), so consumers that buffer output know to discard it
+        self._generation: int = 0
+
     # -------------------------------------------------------------------------
     # Public Methods
     # -------------------------------------------------------------------------
@@ -145,19 +162,22 @@ class EntropyPool:
             # This adds unpredictability even if the input data is known
             timestamp = struct.pack("!d", time.time())
 
-            # Concatenate: current pool + new data + timestamp
-            # The timestamp ensures that even identical data fed at
-            # different times produces different pool states
-            mix_input = self._pool + data + timestamp
+            # Hash: current pool || new data || timestamp
+            # The pool has already been absorbed into the cached midstate,
+            # so only the new bytes need hashing. The timestamp ensures that
+            # even identical data fed at different times produces different
+            # pool states
+            hasher = self._pool_hash.copy()
+            hasher.update(data)
+            hasher.update(timestamp)
 
-            # Hash the concatenation using SHA-256
-            # This produces a 32-byte digest with the avalanche property:
+            # The SHA-256 digest has the avalanche property:
             # changing a single bit in the input flips ~50% of output bits
-            hash_digest = hashlib.sha256(mix_input).digest()
+            hash_digest = hasher.digest()
 
             # Expand the hash to fill the entire pool
             # We do this by repeatedly hashing with a counter
-            self._pool = self._expand_to_pool_size(hash_digest)
+            self._set_state(self._expand_to_pool_size(hash_digest))
 
             # Update entropy estimate
             # We add the estimated entropy but cap at pool size
@@ -166,6 +186,57 @@ class EntropyPool:
             # Update statistics
             self._last_feed_time = time.time()
             self._total_fed += len(data)
+            self._generation += 1
+
+    def feed_batch(self, samples: Sequence[bytes], entropy_estimate: int = 0) -> None:
+        """
+        Feed several independent samples into the pool in one mixing step.
+
+        The background collector gathers one sample per harvester each
+        cycle. Mixing them together costs a single hash-and-expand pass
+        instead of one per sample, which is where most of the time in
+        feed() goes.
+
+        The mixing formula is:
+            new_state = expand(SHA256(old_state || len(s1) || s1 || ...
+                                      || len(sN) || sN || timestamp))
+
+        Each sample is length-prefixed so that different splits of the
+        same bytes never produce the same hash input.
+
+        Args:
+            samples: Raw byte strings to feed. Empty samples are skipped.
+            entropy_estimate: Estimated bits of entropy in all samples
+                            combined. Used for health monitoring only.
+
+        Example:
+            >>> pool = EntropyPool()
+            >>> pool.feed_batch([b"timing", b"system"], entropy_estimate=16)
+        """
+        samples = [sample for sample in samples if sample]
+        if not samples:
+            return  # Nothing to feed
+
+        # Build the whole hash input up front so the hasher is updated in a
+        # single call instead of two per sample
+        parts: list[bytes] = []
+        for sample in samples:
+            parts.append(struct.pack("!Q", len(sample)))
+            parts.append(sample)
+
+        with self._lock:
+            parts.append(struct.pack("!d", time.time()))
+
+            hasher = self._pool_hash.copy()
+            hasher.update(b"".join(parts))
+
+            self._set_state(self._expand_to_pool_size(hasher.digest()))
+
+            self._entropy_bits = min(self._entropy_bits + entropy_estimate, self.POOL_SIZE * 8)
+
+            self._last_feed_time = time.time()
+            self._total_fed += sum(len(sample) for sample in samples)
+            self._generation += 1
 
     def extract(self, num_bytes: int) -> bytes:
         """
@@ -194,39 +265,85 @@ class EntropyPool:
             raise ValueError("num_bytes must be positive")
 
         with self._lock:
-            # Generate output by hashing pool with extraction counter
-            # This ensures forward secrecy: knowing the output doesn't
-            # reveal the pool state or allow prediction of future outputs
+            return bytes(self._generate(num_bytes))
 
-            result = b""
-            counter = 0
+    def extract_into(self, buffer: bytearray | memoryview) -> int:
+        """
+        Extract entropy from the pool directly into a writable buffer.
 
-            while len(result) < num_bytes:
-                # Create extraction hash input:
-                # pool || counter || "extract" marker
-                extract_input = self._pool + struct.pack("!Q", counter) + b"extract"
+        Produces exactly the bytes that extract(len(buffer)) would return,
+        but copies them straight into the caller's buffer so hot loops
+        can refill one preallocated bytearray instead of allocating a new
+        bytes object per call.
 
-                # Generate hash
-                hash_output = hashlib.sha256(extract_input).digest()
-                result += hash_output
-                counter += 1
+        Args:
+            buffer: Writable, C-contiguous buffer (bytearray, memoryview,
+                array.array, ...) to fill completely
 
-            # Trim to exact requested size
-            result = result[:num_bytes]
+        Returns:
+            Number of bytes written (the buffer size in bytes)
 
-            # Update pool state to prevent reuse (forward secrecy)
-            # We mix the extraction operation back into the pool
-            update_input = self._pool + result + b"update"
-            self._pool = self._expand_to_pool_size(hashlib.sha256(update_input).digest())
+        Raises:
+            TypeError: If the buffer is read-only
+            ValueError: If the buffer is empty
 
-            # Decrease entropy estimate
-            # We assume each extracted bit removes one bit of entropy
-            self._entropy_bits = max(0, self._entropy_bits - (num_bytes * 8))
+        Example:
+            >>> pool = EntropyPool()
+            >>> buf = bytearray(32)
+            >>> pool.extract_into(buf)
+            32
+        """
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            raise TypeError("buffer must be writable")
 
-            # Update statistics
-            self._total_extracted += num_bytes
+        num_bytes = view.nbytes
+        if num_bytes == 0:
+            raise ValueError("buffer must not be empty")
+
+        with self._lock:
+            view[:] = self._generate(num_bytes)
+
+        return num_bytes
+
+    def _generate(self, num_bytes: int) -> memoryview:
+        """
+        Produce output and rekey the pool (caller must hold the lock).
+
+        Fortuna-style split: SHA-256 only derives a 32-byte output key
+        from the pool, and SHAKE-256 expands that key into the output
+        stream in a single C call, so large extractions are not bound
+        by one Python-level hash per 32-byte block.
+
+        Args:
+            num_bytes: Number of output bytes to produce
+
+        Returns:
+            A view of num_bytes fresh output bytes
+        """
+        # Output key: SHA256(pool || "extract")
+        key = self._pool_hash.copy()
+        key.update(b"extract")
+
+        # One extra block is squeezed but never handed out
+        stream = memoryview(hashlib.shake_256(key.digest()).digest(num_bytes + self.HASH_SIZE))
 
-            return result
+        # Update pool state to prevent reuse (forward secrecy)
+        # The hidden tail of the stream is mixed back into the pool:
+        # SHA256(pool || tail || "update")
+        hasher = self._pool_hash.copy()
+        hasher.update(stream[num_bytes:])
+        hasher.update(b"update")
+        self._set_state(self._expand_to_pool_size(hasher.digest()))
+
+        # Decrease entropy estimate
+        # We assume each extracted bit removes one bit of entropy
+        self._entropy_bits = max(0, self._entropy_bits - (num_bytes * 8))
+
+        # Update statistics
+        self._total_extracted += num_bytes
+
+        return stream[:num_bytes]
 
     def reseed(self) -> None:
         """
@@ -277,10 +394,41 @@ class EntropyPool:
         with self._lock:
             return self._total_extracted
 
+    @property
+    def generation(self) -> int:
+        """
+        Get a counter that changes whenever the pool is fed, reseeded or
+        restored.
+
+        Anything that buffers extracted bytes should discard them once
+        this value changes, so that a reseed() takes effect immediately.
+        Read without the lock: it is checked on every buffered draw, and
+        reading an int attribute is atomic.
+        """
+        return self._generation
+
     # -------------------------------------------------------------------------
     # Private Methods
     # -------------------------------------------------------------------------
 
+    def _set_state(self, state: bytes) -> None:
+        """
+        Replace the pool state and refresh its cached SHA-256 midstate.
+
+        Every mixing step hashes ``state || suffix``. Absorbing the state
+        once here lets feed() and extract() copy the midstate instead of
+        concatenating and re-hashing the full pool on every call. The
+        hashlib backend (OpenSSL) already dispatches to SHA-NI or SIMD
+        code at runtime, so the remaining cost is the bytes we hash.
+
+        Must be called with the lock held (or from __init__).
+
+        Args:
+            state: The new pool state (POOL_SIZE bytes)
+        """
+        self._pool: bytes = state
+        self._pool_hash = hashlib.sha256(state)
+
     def _expand_to_pool_size(self, data: bytes) -> bytes:
         """
         Expand a small amount of data to fill the entire pool.
@@ -294,17 +442,18 @@ class EntropyPool:
         Returns:
             Bytes of exactly POOL_SIZE length
         """
-        result = b""
-        counter = 0
+        # Hash data once; each block only appends its counter to a copy
+        # of that midstate: block_i = SHA256(data || counter_i)
+        base = hashlib.sha256(data)
+        blocks: list[bytes] = []
 
-        while len(result) < self.POOL_SIZE:
-            # Hash: data || counter
-            expand_input = data + struct.pack("!Q", counter)
-            result += hashlib.sha256(expand_input).digest()
-            counter += 1
+        for counter_block in self._EXPAND_COUNTERS:
+            block = base.copy()
+            block.update(counter_block)
+            blocks.append(block.digest())
 
         # Trim to exact pool size
-        return result[: self.POOL_SIZE]
+        return b"".join(blocks)[: self.POOL_SIZE]
 
     # -------------------------------------------------------------------------
     # Persistence Support
@@ -336,11 +485,12 @@ class EntropyPool:
             state_data: Dictionary from _get_state_for_persistence()
         """
         with self._lock:
-            self._pool = state_data["state"]
+            self._set_state(state_data["state"])
             self._entropy_bits = state_data["entropy_bits"]
             self._total_fed = state_data["total_fed"]
             self._total_extracted = state_data["total_extracted"]
             self._last_feed_time = time.time()
+            self._generation += 1
 
     # -------------------------------------------------------------------------
     # String Representation
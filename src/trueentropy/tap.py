@@ -22,16 +22,144 @@ into various random value types (float, int, bool, bytes, etc.).
 
 from __future__ import annotations
 
-import struct
+import functools
+import math
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import MutableSequence, Sequence
 from typing import Any, TypeVar
 
+from trueentropy.accel import (
+    BYTES_PER_INDEX,
+    MAX_INDEX_RANGE,
+    bounded_ints,
+    sample_entropy_size,
+    sample_indices,
+    shuffle_in_place,
+)
 from trueentropy.pool import EntropyPool
 
 # Type variable for generic sequence operations
 T = TypeVar("T")
 
+# Widest range randint() serves with a single multiply-shift
+_U64_RANGE = 1 << 64
+
+# A double has a 53-bit significand: random() draws 7 bytes and keeps the
+# top 53 bits, then scales by 2^-53 (exact, and cheaper than dividing)
+_RANDOM_BYTES = 7
+_RANDOM_SHIFT = _RANDOM_BYTES * 8 - 53
+_INV_2_53 = 1.0 / (1 << 53)
+
+# Fused multiply-add (Python 3.13+), used by uniform() when available
+_fma = getattr(math, "fma", None)
+
+# Math functions used by the distributions, bound once at import time
+_sqrt = math.sqrt
+_log = math.log
+
+# Objects holding buffered pool output, cleared in the child after fork()
+_fork_buffers: weakref.WeakSet[Any] = weakref.WeakSet()
+
+
+def _reset_buffers_after_fork() -> None:
+    """Drop every buffered draw in a freshly forked child process."""
+    for owner in list(_fork_buffers):
+        owner._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_buffers_after_fork)
+
+
+@functools.lru_cache(maxsize=256)
+def _wide_params(s: int) -> tuple[int, int, int, int]:
+    """
+    Multiply-shift parameters for a range of s values (256 < s <= 2^64).
+
+    Cached because callers tend to repeat the same few ranges, and the
+    rejection threshold costs a big-integer modulo to compute.
+
+    Returns:
+        (bytes per draw, bits per draw, low-bits mask, rejection threshold)
+    """
+    nbytes = BYTES_PER_INDEX if s <= MAX_INDEX_RANGE else 8
+    bits = nbytes * 8
+    return nbytes, bits, (1 << bits) - 1, ((1 << bits) - s) % s
+
+
+class _ByteReader:
+    """
+    Serves small reads from a buffered chunk of pool output.
+
+    The chunk is refilled with a single pool extraction whenever it runs
+    out, so callers that need a few bytes at a time (randint() and its
+    rejection loop, the rejection fallback of shuffle() and sample()) do
+    not pay for an extraction, and the pool rekey behind it, on every read.
+    The chunk is discarded when the pool is fed or reseeded, and after
+    fork(), so buffered bytes never outlive the state they came from.
+    Safe to share between threads.
+    """
+
+    def __init__(self, pool: EntropyPool, chunk_size: int) -> None:
+        """
+        Args:
+            pool: The pool to extract chunks from
+            chunk_size: Bytes extracted per refill
+        """
+        self._pool = pool
+        self._chunk_size = chunk_size
+        self._buf = b""
+        self._pos = 0
+        self._generation = pool.generation
+        self._lock = threading.Lock()
+        _fork_buffers.add(self)
+
+    def read(self, n: int) -> bytes:
+        """Return the next n buffered bytes, refilling as needed."""
+        with self._lock:
+            self._drop_if_stale()
+            pos = self._pos
+            end = pos + n
+
+            if end > len(self._buf):
+                # Keep the unread tail and append a fresh chunk
+                fresh = self._pool.extract(max(self._chunk_size, n))
+                self._buf = self._buf[pos:] + fresh
+                pos, end = 0, n
+
+            self._pos = end
+            return self._buf[pos:end]
+
+    def read_byte(self) -> int:
+        """Return the next buffered byte as an int, refilling as needed."""
+        with self._lock:
+            self._drop_if_stale()
+            pos = self._pos
+
+            if pos >= len(self._buf):
+                self._buf = self._pool.extract(self._chunk_size)
+                pos = 0
+
+            self._pos = pos + 1
+            return self._buf[pos]
+
+    def _drop_if_stale(self) -> None:
+        """Discard the chunk if the pool changed since it was extracted."""
+        generation = self._pool.generation
+        if generation != self._generation:
+            self._buf = b""
+            self._pos = 0
+            self._generation = generation
+
+    def _reset_after_fork(self) -> None:
+        """Discard the chunk in a forked child (the lock may be held)."""
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
 
 class BaseTap(ABC):
     """
@@ -41,6 +169,9 @@ class BaseTap(ABC):
     dependent on the core random primitives.
     """
 
+    # Second normal value of the last polar-method pair, see gauss()
+    _gauss_next: float | None = None
+
     @abstractmethod
     def random(self) -> float:
         """Generate a random float in the range [0.0, 1.0)."""
@@ -64,6 +195,80 @@ class BaseTap(ABC):
         """
         return self.random() < 0.5
 
+    def randbytes_into(self, buffer: bytearray | memoryview) -> int:
+        """
+        Fill a writable buffer with random bytes.
+
+        Default implementation copies the result of randbytes() into the
+        buffer. Subclasses can override it to write in place.
+
+        Args:
+            buffer: Writable, C-contiguous buffer to fill completely
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            TypeError: If the buffer is read-only
+            ValueError: If the buffer is empty
+        """
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            raise TypeError("randbytes_into: buffer must be writable")
+
+        if view.nbytes == 0:
+            raise ValueError("randbytes_into: buffer must not be empty")
+
+        view[:] = self.randbytes(view.nbytes)
+        return view.nbytes
+
+    def randoms(self, n: int) -> list[float]:
+        """
+        Generate n random floats, each in the range [0.0, 1.0).
+
+        Default implementation calls random() n times. Subclasses can
+        override it to draw the entropy for the whole batch at once.
+
+        Args:
+            n: Number of floats to generate
+
+        Returns:
+            A list of n random floats in [0.0, 1.0)
+
+        Raises:
+            ValueError: If n < 0
+        """
+        if n < 0:
+            raise ValueError(f"randoms: n ({n}) must be non-negative")
+
+        return [self.random() for _ in range(n)]
+
+    def randints(self, a: int, b: int, n: int) -> list[int]:
+        """
+        Generate n random integers, each uniform in [a, b].
+
+        Default implementation calls randint() n times. Subclasses can
+        override it to draw the entropy for the whole batch at once.
+
+        Args:
+            a: Lower bound (inclusive)
+            b: Upper bound (inclusive)
+            n: Number of integers to generate
+
+        Returns:
+            A list of n random integers in [a, b]
+
+        Raises:
+            ValueError: If a > b or n < 0
+        """
+        if a > b:
+            raise ValueError(f"randints: a ({a}) must be <= b ({b})")
+
+        if n < 0:
+            raise ValueError(f"randints: n ({n}) must be non-negative")
+
+        return [self.randint(a, b) for _ in range(n)]
+
     def choice(self, seq: Sequence[T]) -> T:
         """
         Return a random element from a non-empty sequence.
@@ -82,6 +287,9 @@ class BaseTap(ABC):
         if not seq:
             raise IndexError("Cannot choose from an empty sequence")
 
+        if len(seq) == 1:
+            return seq[0]  # Only one possible element
+
         # Generate random index in valid range
         index = self.randint(0, len(seq) - 1)
 
@@ -106,6 +314,9 @@ class BaseTap(ABC):
         """
         n = len(seq)
 
+        if n < 2:
+            return  # Nothing to shuffle
+
         # Fisher-Yates shuffle
         # We iterate from the end to the beginning
         for i in range(n - 1, 0, -1):
@@ -136,6 +347,8 @@ class BaseTap(ABC):
             We use a modified Fisher-Yates algorithm that only
             shuffles the first k elements, then returns them.
             This is more efficient than shuffling the entire sequence.
+            When k is small relative to n, only the swapped positions
+            are tracked (in a dict), so no n-element list is built.
         """
         n = len(seq)
 
@@ -148,13 +361,25 @@ class BaseTap(ABC):
         if k == 0:
             return []
 
+        # Partial Fisher-Yates: shuffle only k elements
+        result: list[T] = []
+
+        if k * 8 < n:
+            # Sparse variant: positions never swapped still hold their
+            # own index, so only the displaced ones need storing
+            swaps: dict[int, int] = {}
+
+            for i in range(k):
+                j = self.randint(i, n - 1)
+                result.append(seq[swaps.get(j, j)])
+                swaps[j] = swaps.get(i, i)
+
+            return result
+
         # Create a copy of the sequence as a list
         # We only need to work with indices, so we create a pool
         pool = list(range(n))
 
-        # Partial Fisher-Yates: shuffle only k elements
-        result: list[T] = []
-
         for i in range(k):
             # Pick random index from remaining pool
             j = self.randint(i, n - 1)
@@ -171,6 +396,9 @@ class BaseTap(ABC):
         """
         Generate a random float N such that a <= N <= b.
 
+        The end-point b may or may not be included, depending on
+        floating-point rounding.
+
         Args:
             a: Lower bound
             b: Upper bound
@@ -178,14 +406,26 @@ class BaseTap(ABC):
         Returns:
             Random float in [a, b]
         """
-        return a + self.random() * (b - a)
+        u = self.random()
+        width = b - a
+
+        if math.isfinite(width):
+            if _fma is not None:
+                # Same value with a single rounding
+                return _fma(u, width, a)
+            return a + u * width
+
+        # b - a overflowed (e.g. uniform(-1e308, 1e308)): use the weighted
+        # form, which has no width term and so stays finite
+        return (1.0 - u) * a + u * b
 
     def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
         """
         Generate a random float from the Gaussian (normal) distribution.
 
-        Uses the Box-Muller transform to convert uniform random numbers
-        to normally distributed values.
+        Uses Marsaglia's polar method, which turns a pair of uniform
+        random numbers into two independent normal values without any
+        trigonometric calls. The second value is kept for the next call.
 
         Args:
             mu: Mean of the distribution (default: 0.0)
@@ -194,22 +434,28 @@ class BaseTap(ABC):
         Returns:
             Random float from N(mu, sigma^2)
         """
-        import math
-
-        # Box-Muller transform
-        # Generate two uniform random values in (0, 1)
-        # We need them to be strictly > 0 to avoid log(0)
-        u1 = self.random()
-        while u1 == 0:
-            u1 = self.random()
-
-        u2 = self.random()
+        # Use the value left over from the previous pair, if any.
+        # dict.pop() takes it atomically, so two threads never share it.
+        z = self.__dict__.pop("_gauss_next", None)
+        if z is not None:
+            return mu + sigma * z
+
+        # Polar method
+        # Pick a point uniformly inside the unit circle (excluding the
+        # origin to avoid log(0)), about 79% of points are accepted
+        while True:
+            v1 = 2.0 * self.random() - 1.0
+            v2 = 2.0 * self.random() - 1.0
+            s = v1 * v1 + v2 * v2
+            if 0.0 < s < 1.0:
+                break
 
-        # Transform to standard normal
-        z0 = math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
+        # Transform to two standard normals
+        factor = _sqrt(-2.0 * _log(s) / s)
+        self._gauss_next = v2 * factor
 
         # Scale and shift to desired mean and standard deviation
-        return mu + sigma * z0
+        return mu + sigma * (v1 * factor)
 
     def triangular(self, low: float = 0.0, high: float = 1.0, mode: float | None = None) -> float:
         """
@@ -229,8 +475,6 @@ class BaseTap(ABC):
         Raises:
             ValueError: If low > high or mode is outside [low, high]
         """
-        import math
-
         if low > high:
             raise ValueError(f"triangular: low ({low}) must be <= high ({high})")
 
@@ -248,9 +492,9 @@ class BaseTap(ABC):
         c = (mode - low) / (high - low)
 
         if u < c:
-            return low + math.sqrt(u * (high - low) * (mode - low))
+            return low + _sqrt(u * (high - low) * (mode - low))
         else:
-            return high - math.sqrt((1 - u) * (high - low) * (high - mode))
+            return high - _sqrt((1 - u) * (high - low) * (high - mode))
 
     def exponential(self, lambd: float = 1.0) -> float:
         """
@@ -269,8 +513,6 @@ class BaseTap(ABC):
         Raises:
             ValueError: If lambd <= 0
         """
-        import math
-
         if lambd <= 0:
             raise ValueError(f"exponential: lambd ({lambd}) must be positive")
 
@@ -280,7 +522,7 @@ class BaseTap(ABC):
         while u == 0:  # Avoid log(0)
             u = self.random()
 
-        return -math.log(u) / lambd
+        return -_log(u) / lambd
 
     def weighted_choice(self, seq: Sequence[T], weights: Sequence[float]) -> T:
         """
@@ -457,8 +699,10 @@ class BaseTap(ABC):
             if not chars:
                 raise ValueError("random_password: at least one character type must be included")
 
-        # Generate password by choosing random characters
-        return "".join(self.choice(chars) for _ in range(length))
+        # Generate password by choosing random characters, drawing all
+        # indices in one batch rather than one choice() call per character
+        indices = self.randints(0, len(chars) - 1, length)
+        return "".join([chars[i] for i in indices])
 
 
 class EntropyTap(BaseTap):
@@ -476,6 +720,16 @@ class EntropyTap(BaseTap):
         >>> print(f"Random: {value}")
     """
 
+    # randint() draws are served from a buffered burst of pool output
+    # (one byte at a time for small ranges such as dice), so they don't
+    # each pay for a full pool extraction
+    BURST_SIZE = 64
+    SMALL_RANGE_MAX = 256
+
+    # gauss() draws the uniforms for this many polar-method pairs at once
+    # (about 25 normals from 224 bytes)
+    GAUSS_BATCH = 16
+
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
@@ -489,6 +743,24 @@ class EntropyTap(BaseTap):
         """
         self._pool = pool
 
+        # Buffered burst for randint() draws
+        self._reader = _ByteReader(pool, self.BURST_SIZE)
+
+        # Unused bits of the last 64-bit randbool() draw, and the pool
+        # generation they were drawn in
+        self._bool_buf = 0
+        self._bool_bits = 0
+        self._bool_generation = pool.generation
+        self._bool_lock = threading.Lock()
+
+        # Buffered standard normals for gauss(), and the pool generation
+        # they were drawn in
+        self._normals: list[float] = []
+        self._normals_generation = pool.generation
+        self._normals_lock = threading.Lock()
+
+        _fork_buffers.add(self)
+
     # -------------------------------------------------------------------------
     # Random Value Generation
     # -------------------------------------------------------------------------
@@ -497,34 +769,32 @@ class EntropyTap(BaseTap):
         """
         Generate a random float in the range [0.0, 1.0).
 
-        Uses 64 bits of entropy to generate a uniformly distributed
-        floating-point number. The result is always less than 1.0.
+        Uses 53 bits of entropy, the full precision of a double, to
+        generate a uniformly distributed floating-point number. The
+        result is always less than 1.0.
 
         Returns:
             A float value where 0.0 <= value < 1.0
 
         How it works:
-            1. Extract 8 bytes (64 bits) from the pool
-            2. Interpret as unsigned 64-bit integer
-            3. Divide by 2^64 to get value in [0, 1)
+            1. Extract 7 bytes (56 bits) from the pool
+            2. Keep the top 53 bits as an unsigned integer
+            3. Multiply by 2^-53 to get value in [0, 1)
         """
-        # Extract 8 bytes of entropy
-        raw_bytes = self._pool.extract(8)
-
-        # Unpack as unsigned 64-bit integer (big-endian)
+        # Extract 7 bytes of entropy
         # We use big-endian for consistency across platforms
-        value = struct.unpack("!Q", raw_bytes)[0]
+        value = int.from_bytes(self._pool.extract(_RANDOM_BYTES), "big") >> _RANDOM_SHIFT
 
-        # Convert to float in range [0.0, 1.0)
-        # 2^64 = 18446744073709551616
-        return value / 18446744073709551616.0
+        # Convert to float in range [0.0, 1.0); every 53-bit value is
+        # exactly representable, so the result can never round up to 1.0
+        return value * _INV_2_53
 
     def randint(self, a: int, b: int) -> int:
         """
         Generate a random integer N such that a <= N <= b.
 
-        Uses rejection sampling to ensure uniform distribution.
-        This avoids modulo bias that would occur with simple modulo.
+        Uses Lemire's multiply-shift range reduction, with exact rejection
+        of the few biased draws, so the result is perfectly uniform.
 
         Args:
             a: Lower bound (inclusive)
@@ -537,11 +807,14 @@ class EntropyTap(BaseTap):
             ValueError: If a > b
 
         How it works:
-            1. Calculate the range size (b - a + 1)
-            2. Find the smallest number of bits needed to represent range
-            3. Generate random bits and check if value < range
-            4. If not, reject and try again (rejection sampling)
-            5. This ensures perfectly uniform distribution
+            1. Calculate the range size s = b - a + 1
+            2. Draw a w-bit word x (w = 8, 32 or 64 depending on s)
+            3. Compute m = x * s; the candidate is m >> w, which is in [0, s)
+            4. Reject only if the low w bits of m fall below (2^w - s) % s,
+               which happens with probability < s / 2^w
+            5. Ranges wider than 2^64 fall back to bit-mask rejection
+            6. Power-of-two ranges skip all of the above: the low bits of
+               a single draw are already uniform over the range
         """
         if a > b:
             raise ValueError(f"randint: a ({a}) must be <= b ({b})")
@@ -552,6 +825,24 @@ class EntropyTap(BaseTap):
         # Calculate range size
         range_size = b - a + 1
 
+        # Power-of-two ranges: the masked bits cover the range exactly,
+        # so a single draw is always accepted
+        if range_size & (range_size - 1) == 0:
+            if range_size <= 256:
+                return a + (self._reader.read_byte() & (range_size - 1))
+            bits_needed = range_size.bit_length() - 1
+            raw = self._reader.read((bits_needed + 7) // 8)
+            return a + (int.from_bytes(raw, "big") & (range_size - 1))
+
+        # Small ranges: one buffered byte per attempt
+        if range_size <= self.SMALL_RANGE_MAX:
+            return a + self._small_below(range_size)
+
+        # Up to 64 bits: a 32- or 64-bit word per attempt
+        if range_size <= _U64_RANGE:
+            return a + self._wide_below(range_size)
+
+        # Wider ranges: bit-mask rejection sampling
         # Find number of bits needed to represent range_size
         # We need ceil(log2(range_size)) bits
         bits_needed = (range_size - 1).bit_length()
@@ -564,18 +855,11 @@ class EntropyTap(BaseTap):
         # Rejection sampling loop
         # We keep generating random values until we get one in range
         # Expected number of iterations is < 2 on average
+        read = self._reader.read
         while True:
-            # Extract random bytes
-            raw_bytes = self._pool.extract(bytes_needed)
-
-            # Pad to 8 bytes for unpacking (big-endian)
-            padded = raw_bytes.rjust(8, b"\x00")
-
-            # Unpack as unsigned 64-bit integer
-            value = struct.unpack("!Q", padded)[0]
-
-            # Apply mask to get only needed bits
-            value = value & mask
+            # Take random bytes from the buffered burst and keep only the
+            # bits we need (int.from_bytes handles any length, no padding)
+            value = int.from_bytes(read(bytes_needed), "big") & mask
 
             # Check if value is in valid range
             if value < range_size:
@@ -591,34 +875,315 @@ class EntropyTap(BaseTap):
             True or False with equal probability
 
         How it works:
-            1. Extract 1 byte from the pool
-            2. Check the least significant bit
-            3. Return True if bit is 1, False if 0
+            1. Extract 8 bytes (64 bits) from the pool when the bit
+               buffer is empty or the pool has been fed since
+            2. Take the least significant bit of the buffer
+            3. Return True if bit is 1, False if 0, and shift it out
         """
-        # Extract 1 byte of entropy
-        raw_byte = self._pool.extract(1)
+        with self._bool_lock:
+            generation = self._pool.generation
+            if self._bool_bits == 0 or generation != self._bool_generation:
+                # Refill: one extraction serves the next 64 calls
+                self._bool_buf = int.from_bytes(self._pool.extract(8), "big")
+                self._bool_bits = 64
+                self._bool_generation = generation
+
+            bit = self._bool_buf & 1
+            self._bool_buf >>= 1
+            self._bool_bits -= 1
 
-        # Check least significant bit
-        return (raw_byte[0] & 1) == 1
+        return bit == 1
 
     def randbytes(self, n: int) -> bytes:
         """
         Generate n random bytes.
 
         Args:
-            n: Number of bytes to generate (must be positive)
+            n: Number of bytes to generate (must be non-negative)
 
         Returns:
             A bytes object of length n
 
         Raises:
-            ValueError: If n is not positive
+            ValueError: If n is negative
         """
         if n <= 0:
-            raise ValueError(f"randbytes: n ({n}) must be positive")
+            if n == 0:
+                return b""  # Nothing to extract
+            raise ValueError(f"randbytes: n ({n}) must be non-negative")
 
         return self._pool.extract(n)
 
+    def randbytes_into(self, buffer: bytearray | memoryview) -> int:
+        """
+        Fill a writable buffer with random bytes, without allocating.
+
+        The pool writes its output blocks directly into the buffer, so a
+        caller generating many tokens can reuse one bytearray.
+
+        Args:
+            buffer: Writable, C-contiguous buffer to fill completely
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            TypeError: If the buffer is read-only
+            ValueError: If the buffer is empty
+        """
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            raise TypeError("randbytes_into: buffer must be writable")
+
+        if view.nbytes == 0:
+            raise ValueError("randbytes_into: buffer must not be empty")
+
+        return self._pool.extract_into(view)
+
+    def randoms(self, n: int) -> list[float]:
+        """
+        Generate n random floats, each in the range [0.0, 1.0).
+
+        Same 53-bit conversion as random(), but the entropy for the
+        whole batch is drawn in a single pool extraction.
+
+        Args:
+            n: Number of floats to generate
+
+        Returns:
+            A list of n random floats in [0.0, 1.0)
+
+        Raises:
+            ValueError: If n < 0
+        """
+        if n <= 0:
+            return super().randoms(n)
+
+        raw = self._pool.extract(_RANDOM_BYTES * n)
+        return [
+            (int.from_bytes(raw[i : i + _RANDOM_BYTES], "big") >> _RANDOM_SHIFT) * _INV_2_53
+            for i in range(0, len(raw), _RANDOM_BYTES)
+        ]
+
+    def randints(self, a: int, b: int, n: int) -> list[int]:
+        """
+        Generate n random integers, each uniform in [a, b].
+
+        For ranges of up to 2^32 values the entropy for the whole batch
+        is drawn in a single pool extraction, instead of one extraction
+        (or more, on rejection) per randint() call.
+
+        Args:
+            a: Lower bound (inclusive)
+            b: Upper bound (inclusive)
+            n: Number of integers to generate
+
+        Returns:
+            A list of n random integers in [a, b]
+
+        Raises:
+            ValueError: If a > b or n < 0
+        """
+        range_size = b - a + 1
+
+        if a > b or n <= 0 or range_size > MAX_INDEX_RANGE:
+            return super().randints(a, b, n)
+
+        if a == b:
+            return [a] * n
+
+        rand = self._pool.extract(BYTES_PER_INDEX * n)
+        return bounded_ints(a, range_size, n, rand, self._randbelow)
+
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        """
+        Generate a random float from the Gaussian (normal) distribution.
+
+        Same polar method as BaseTap.gauss(), but the uniforms for a
+        batch of GAUSS_BATCH pairs are drawn in a single pool extraction
+        and the resulting normals are buffered for later calls.
+
+        Args:
+            mu: Mean of the distribution (default: 0.0)
+            sigma: Standard deviation (default: 1.0)
+
+        Returns:
+            Random float from N(mu, sigma^2)
+        """
+        with self._normals_lock:
+            generation = self._pool.generation
+            if generation != self._normals_generation:
+                # The pool was fed or reseeded: drop normals drawn before
+                self._normals.clear()
+                self._normals_generation = generation
+
+            if not self._normals:
+                self._refill_normals()
+
+            z = self._normals.pop()
+
+        return mu + sigma * z
+
+    # -------------------------------------------------------------------------
+    # Sequence Operations
+    # -------------------------------------------------------------------------
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        Return a random element from a non-empty sequence.
+
+        The index is drawn straight from the buffered burst (one byte
+        for sequences of up to 256 elements), skipping randint().
+
+        Args:
+            seq: A non-empty sequence (list, tuple, string, etc.)
+
+        Returns:
+            A randomly selected element
+
+        Raises:
+            IndexError: If the sequence is empty
+        """
+        n = len(seq)
+
+        if n <= 1:
+            if n == 0:
+                raise IndexError("Cannot choose from an empty sequence")
+            return seq[0]  # Only one possible element
+
+        return seq[self._randbelow(n)]
+
+    def shuffle(self, seq: MutableSequence[Any]) -> None:
+        """
+        Shuffle a mutable sequence in-place.
+
+        Same Fisher-Yates algorithm as BaseTap.shuffle(), but all the
+        entropy for the shuffle is drawn in a single pool extraction and
+        the swap loop runs in the accelerated kernel (Cython when built).
+
+        Args:
+            seq: A mutable sequence to shuffle in-place
+        """
+        n = len(seq)
+
+        if n > MAX_INDEX_RANGE:
+            super().shuffle(seq)
+            return
+
+        if n < 2:
+            return  # Nothing to shuffle (and nothing to extract)
+
+        rand = self._pool.extract(BYTES_PER_INDEX * (n - 1))
+        shuffle_in_place(seq, rand, self._randbelow)
+
+    def sample(self, seq: Sequence[T], k: int) -> list[T]:
+        """
+        Return a k-length list of unique elements from the sequence.
+
+        The entropy for all k picks is drawn in a single pool extraction.
+        Small samples from large sequences use Floyd's algorithm, so no
+        n-element index list is built.
+
+        Args:
+            seq: The sequence to sample from
+            k: Number of unique elements to select
+
+        Returns:
+            A list of k unique elements
+
+        Raises:
+            ValueError: If k > len(seq) or k < 0
+        """
+        n = len(seq)
+
+        if n > MAX_INDEX_RANGE:
+            return super().sample(seq, k)
+
+        if k < 0:
+            raise ValueError(f"sample: k ({k}) must be non-negative")
+
+        if k > n:
+            raise ValueError(f"sample: k ({k}) is larger than sequence length ({n})")
+
+        if k == 0:
+            return []
+
+        rand = self._pool.extract(sample_entropy_size(n, k))
+        return [seq[i] for i in sample_indices(n, k, rand, self._randbelow)]
+
+    def _refill_normals(self) -> None:
+        """
+        Generate a batch of standard normals into the (empty) buffer.
+
+        Each pair of 53-bit uniforms comes from 14 bytes of one pool
+        extraction; pairs outside the unit circle are skipped.
+        """
+        size = 2 * _RANDOM_BYTES
+        raw = self._pool.extract(size * self.GAUSS_BATCH)
+        normals = self._normals
+
+        for offset in range(0, len(raw), size):
+            u1 = int.from_bytes(raw[offset : offset + _RANDOM_BYTES], "big") >> _RANDOM_SHIFT
+            u2 = int.from_bytes(raw[offset + _RANDOM_BYTES : offset + size], "big") >> _RANDOM_SHIFT
+            v1 = 2.0 * u1 * _INV_2_53 - 1.0
+            v2 = 2.0 * u2 * _INV_2_53 - 1.0
+            s = v1 * v1 + v2 * v2
+            if 0.0 < s < 1.0:
+                factor = _sqrt(-2.0 * _log(s) / s)
+                normals.append(v1 * factor)
+                normals.append(v2 * factor)
+
+        if not normals:
+            # Every pair was rejected (probability ~ 0.215^GAUSS_BATCH)
+            self._refill_normals()
+
+    def _randbelow(self, n: int) -> int:
+        """Return a uniform random integer in [0, n)."""
+        # Same dispatch as randint(), without its argument handling
+        if n <= self.SMALL_RANGE_MAX:
+            return self._small_below(n)
+        if n <= _U64_RANGE:
+            return self._wide_below(n)
+        return self.randint(0, n - 1)
+
+    def _wide_below(self, s: int) -> int:
+        """
+        Return a uniform random integer in [0, s) for 256 < s <= 2^64.
+
+        Lemire's multiply-shift on a 32-bit word when s fits (half the
+        entropy of a 64-bit draw), otherwise on a 64-bit word.
+        """
+        nbytes, bits, low_mask, threshold = _wide_params(s)
+        read = self._reader.read
+
+        while True:
+            m = int.from_bytes(read(nbytes), "big") * s
+            if (m & low_mask) >= threshold:
+                return m >> bits
+
+    def _small_below(self, s: int) -> int:
+        """
+        Return a uniform random integer in [0, s) for 1 <= s <= 256.
+
+        Lemire's multiply-shift on a single byte: x * s >> 8 maps a byte
+        onto [0, s), and the (256 - s) % s lowest products are rejected
+        to remove bias.
+        """
+        threshold = (256 - s) % s
+        read_byte = self._reader.read_byte
+
+        while True:
+            m = read_byte() * s
+            if (m & 0xFF) >= threshold:
+                return m >> 8
+
+    def _reset_after_fork(self) -> None:
+        """Discard buffered draws in a forked child (locks may be held)."""
+        self._bool_lock = threading.Lock()
+        self._bool_bits = 0
+        self._normals_lock = threading.Lock()
+        self._normals = []
+
     # -------------------------------------------------------------------------
     # String Representation
     # -------------------------------------------------------------------------
@@ -131,6 +131,18 @@ class TestHealthAPI:
 
         assert status["status"] in ["healthy", "degraded", "critical"]
 
+    def test_health_cache_tracks_pool_changes(self) -> None:
+        """Cached health results should be private copies and follow extraction."""
+        import trueentropy
+
+        first = trueentropy.health()
+        first["sources"]["timing"]["enabled"] = not first["sources"]["timing"]["enabled"]
+        second = trueentropy.health()
+        assert second["sources"]["timing"] != first["sources"]["timing"]
+
+        trueentropy.randbytes(64)
+        assert trueentropy.health()["entropy_bits"] == trueentropy.get_pool().entropy_bits
+
 
 class TestFeedAPI:
     """Test the manual feed API."""
@@ -184,6 +196,48 @@ class TestAdvancedAPI:
 
         assert isinstance(tap, BaseTap)
 
+    def test_import_does_not_create_pool(self) -> None:
+        """The global pool and tap should be created on first use only."""
+        import subprocess
+        import sys
+
+        code = (
+            "import trueentropy\n"
+            "assert trueentropy._pool is None and trueentropy._tap is None\n"
+            "trueentropy.random()\n"
+            "assert trueentropy.get_tap().__class__.__name__ == 'EntropyTap'\n"
+            "assert trueentropy.get_tap()._pool is trueentropy.get_pool()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestConfiguration:
+    """Test the configuration object."""
+
+    def test_source_sets_match_flags(self) -> None:
+        """enabled/disabled sources should reflect the enable_* flags."""
+        import dataclasses
+
+        import pytest
+
+        from trueentropy.config import ALL_SOURCES, TrueEntropyConfig
+
+        config = TrueEntropyConfig(enable_network=False, enable_weather=False)
+
+        assert config.disabled_sources == {"network", "weather"}
+        assert config.enabled_sources == ALL_SOURCES - {"network", "weather"}
+        assert config.get_source_info("weather") == {"enabled": False, "requires_network": True}
+        assert config.get_source_info("timing") == {"enabled": True, "requires_network": False}
+        assert not config.offline_mode
+
+        # Configs are immutable; copy() builds a new one with fresh caches
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.enable_timing = False  # type: ignore[misc]
+
+        offline = config.copy(enable_external=False, enable_radioactive=False)
+        assert offline.offline_mode
+        assert offline.enabled_sources == {"timing", "system"}
+
 
 class TestBackgroundCollector:
     """Test background collector functionality."""
@@ -229,6 +283,61 @@ class TestBackgroundCollector:
         time.sleep(0.3)
         assert not is_collector_running()
 
+    def test_concurrent_start_and_prompt_stop(self) -> None:
+        """Racing start calls should start one collector; stop should not wait out the interval."""
+        import threading
+
+        import trueentropy
+        from trueentropy.collector import is_collector_running
+
+        starters = [
+            threading.Thread(target=trueentropy.start_collector, kwargs={"interval": 30.0})
+            for _ in range(4)
+        ]
+        for t in starters:
+            t.start()
+        for t in starters:
+            t.join()
+
+        collectors = [t for t in threading.enumerate() if t.name == "TrueEntropy-Collector"]
+        assert len(collectors) == 1
+
+        start = time.perf_counter()
+        trueentropy.stop_collector()
+        assert time.perf_counter() - start < 5.0
+        assert not is_collector_running()
+
+    def test_network_harvesters_overlap(self) -> None:
+        """Network harvesters should run concurrently, results in harvester order."""
+        from trueentropy.collector import _harvest, _make_executor
+        from trueentropy.harvesters.base import BaseHarvester, HarvestResult
+
+        class SlowHarvester(BaseHarvester):
+            def __init__(self, name: str) -> None:
+                self._name = name
+
+            @property
+            def name(self) -> str:
+                return self._name
+
+            def collect(self) -> HarvestResult:
+                time.sleep(0.3)
+                return HarvestResult(data=self._name.encode(), entropy_bits=8, source=self._name)
+
+        harvesters = [SlowHarvester(name) for name in ("network", "weather", "radioactive")]
+        executor = _make_executor(harvesters)
+        assert executor is not None
+
+        try:
+            start = time.perf_counter()
+            results = _harvest(harvesters, executor)
+            elapsed = time.perf_counter() - start
+        finally:
+            executor.shutdown()
+
+        assert [r.source for r in results] == ["network", "weather", "radioactive"]
+        assert elapsed < 0.8
+
     def test_collector_feeds_pool(self) -> None:
         """Collector should feed entropy into the pool."""
         import trueentropy
@@ -116,6 +116,29 @@ class TestEntropyPoolFeed:
 
         assert pool.last_feed_time > initial_time
 
+    def test_feed_batch_updates_state_and_statistics(self) -> None:
+        """feed_batch() should mix all samples and count their bytes."""
+        pool = EntropyPool(seed=b"fixed_seed")
+        initial = pool.extract(32)
+
+        pool2 = EntropyPool(seed=b"fixed_seed")
+        pool2.feed_batch([b"timing", b"", b"system"], entropy_estimate=16)
+
+        assert pool2.extract(32) != initial
+        assert pool2.total_fed == len(b"timing") + len(b"system")
+
+    def test_empty_feed_batch_is_noop(self) -> None:
+        """feed_batch() with no non-empty samples should not change state."""
+        pool = EntropyPool(seed=b"fixed")
+        initial = pool.extract(16)
+
+        pool2 = EntropyPool(seed=b"fixed")
+        pool2.feed_batch([])
+        pool2.feed_batch([b"", b""])
+
+        assert pool2.extract(16) == initial
+        assert pool2.total_fed == 0
+
 
 class TestEntropyPoolExtract:
     """Test EntropyPool extract operation."""
@@ -174,6 +197,17 @@ class TestEntropyPoolExtract:
         second2 = pool2.extract(16)
         assert second1 == second2
 
+    def test_restored_state_extracts_same_bytes(self) -> None:
+        """A pool restored from saved state should continue identically."""
+        pool1 = EntropyPool(seed=b"persisted")
+        pool1.feed(b"some data")
+        state = pool1._get_state_for_persistence()
+
+        pool2 = EntropyPool()
+        pool2._restore_state_from_persistence(state)
+
+        assert pool1.extract(48) == pool2.extract(48)
+
     def test_extract_invalid_size_raises(self) -> None:
         """Extracting zero or negative bytes should raise."""
         pool = EntropyPool()
@@ -184,6 +218,17 @@ class TestEntropyPoolExtract:
         with pytest.raises(ValueError):
             pool.extract(-1)
 
+    def test_extract_into_fills_buffer(self) -> None:
+        """extract_into() should fill any writable buffer like extract()."""
+        pool1 = EntropyPool(seed=b"into")
+        pool2 = EntropyPool(seed=b"into")
+
+        buf = bytearray(70)
+        assert pool1.extract_into(memoryview(buf)[5:]) == 65
+        assert bytes(buf[5:]) == pool2.extract(65)
+        assert buf[:5] == bytearray(5)
+        assert pool1.total_extracted == 65
+
 
 class TestEntropyPoolReseed:
     """Test EntropyPool reseed operation."""
@@ -215,6 +260,24 @@ class TestEntropyPoolReseed:
         # Should have full entropy again
         assert pool.entropy_bits > low_bits
 
+    def test_generation_tracks_state_changes(self) -> None:
+        """generation should change on feed/reseed/restore, not on extract."""
+        pool = EntropyPool()
+        seen = {pool.generation}
+
+        pool.extract(16)
+        assert pool.generation in seen
+
+        for change in (
+            lambda: pool.feed(b"data"),
+            lambda: pool.feed_batch([b"a", b"b"]),
+            pool.reseed,
+            lambda: pool._restore_state_from_persistence(pool._get_state_for_persistence()),
+        ):
+            change()
+            assert pool.generation not in seen
+            seen.add(pool.generation)
+
 
 class TestEntropyPoolThreadSafety:
     """Test EntropyPool thread safety."""
@@ -17,12 +17,14 @@
 from __future__ import annotations
 
 import math
+import os
 from collections import Counter
+from collections.abc import Callable
 
 import pytest
 
 from trueentropy.pool import EntropyPool
-from trueentropy.tap import EntropyTap
+from trueentropy.tap import BaseTap, EntropyTap
 
 
 class TestEntropyTapRandom:
@@ -63,6 +65,36 @@ class TestEntropyTapRandom:
         expected_variance = 1 / 12
         assert abs(variance - expected_variance) < 0.02
 
+    def test_random_never_rounds_up_to_one(self) -> None:
+        """random() should stay below 1.0 even for all-ones entropy."""
+        pool = EntropyPool()
+        pool.extract = lambda n: b"\xff" * n  # type: ignore[method-assign]
+        tap = EntropyTap(pool)
+
+        assert tap.random() == 1.0 - 2.0**-53
+
+    def test_randoms_single_pool_extraction(self) -> None:
+        """randoms() should draw the whole batch in one extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        values = tap.randoms(100)
+
+        assert len(values) == 100
+        assert all(isinstance(v, float) and 0.0 <= v < 1.0 for v in values)
+        assert pool.total_extracted == 7 * 100
+
+    def test_randoms_matches_random(self) -> None:
+        """randoms() should decode its draw exactly like random()."""
+        tap1 = EntropyTap(EntropyPool(seed=b"floats"))
+        tap2 = EntropyTap(EntropyPool(seed=b"floats"))
+
+        assert tap1.randoms(1) == [tap2.random()]
+        assert tap1.randoms(0) == []
+
+        with pytest.raises(ValueError):
+            tap1.randoms(-1)
+
 
 class TestEntropyTapRandint:
     """Test EntropyTap.randint() method."""
@@ -122,6 +154,112 @@ class TestEntropyTapRandint:
         for face in range(1, 7):
             assert 800 < counts[face] < 1200
 
+    def test_randint_small_range_uses_burst(self) -> None:
+        """Small-range randint() calls should share one buffered extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for _ in range(10):
+            tap.randint(1, 6)
+
+        assert pool.total_extracted == EntropyTap.BURST_SIZE
+
+        # A full byte range has no rejection and hits every value
+        values = {tap.randint(0, 255) for _ in range(5000)}
+        assert values == set(range(256))
+
+    def test_randint_beyond_64_bits(self) -> None:
+        """randint() should handle ranges wider than 2^64."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        values = [tap.randint(0, 2**100) for _ in range(100)]
+
+        assert all(0 <= v <= 2**100 for v in values)
+        assert max(values) > 2**64
+
+    def test_randint_large_range_uses_burst(self) -> None:
+        """Wider randint() draws should also come from the buffered burst."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        # A full 32-bit range never rejects: 4 bytes per call
+        for _ in range(EntropyTap.BURST_SIZE // 4):
+            assert 0 <= tap.randint(0, 2**32 - 1) < 2**32
+
+        assert pool.total_extracted == EntropyTap.BURST_SIZE
+
+        # Leave 3 unread bytes, then read 8: the tail is kept and one
+        # more burst is extracted
+        tap.randint(0, 255)
+        for _ in range(15):
+            tap.randint(0, 2**32 - 1)
+        assert pool.total_extracted == 2 * EntropyTap.BURST_SIZE
+
+        tap.randint(0, 2**64 - 1)
+        assert pool.total_extracted == 3 * EntropyTap.BURST_SIZE
+
+    def test_randint_power_of_two_range_single_draw(self) -> None:
+        """Power-of-two ranges should take exactly one draw per call."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        # 1024 values need 10 bits: 2 bytes per call, never rejected
+        values = [tap.randint(-512, 511) for _ in range(EntropyTap.BURST_SIZE // 2)]
+
+        assert pool.total_extracted == EntropyTap.BURST_SIZE
+        assert all(-512 <= v <= 511 for v in values)
+
+        assert {tap.randint(10, 17) for _ in range(500)} == set(range(10, 18))
+        assert 0 <= tap.randint(0, 2**70 - 1) < 2**70
+
+
+class TestEntropyTapRandints:
+    """Test EntropyTap.randints() method."""
+
+    def test_randints_in_range(self) -> None:
+        """randints(a, b, n) should return n values in [a, b]."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        values = tap.randints(1, 6, 1000)
+
+        assert len(values) == 1000
+        assert all(1 <= v <= 6 for v in values)
+        assert set(values) == {1, 2, 3, 4, 5, 6}
+
+    def test_randints_single_pool_extraction(self) -> None:
+        """randints() should draw the whole batch in one extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        tap.randints(0, 99, 50)
+
+        assert pool.total_extracted == 4 * 50
+
+    def test_randints_large_range(self) -> None:
+        """randints() should support ranges wider than 32 bits."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        values = tap.randints(0, 2**40, 20)
+
+        assert all(0 <= v <= 2**40 for v in values)
+
+    def test_randints_edge_cases(self) -> None:
+        """randints() should handle empty batches and invalid input."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        assert tap.randints(1, 6, 0) == []
+        assert tap.randints(5, 5, 3) == [5, 5, 5]
+
+        with pytest.raises(ValueError):
+            tap.randints(6, 1, 3)
+
+        with pytest.raises(ValueError):
+            tap.randints(1, 6, -1)
+
 
 class TestEntropyTapRandbool:
     """Test EntropyTap.randbool() method."""
@@ -149,6 +287,18 @@ class TestEntropyTapRandbool:
         assert 4500 < true_count < 5500
         assert 4500 < false_count < 5500
 
+    def test_randbool_uses_every_bit_of_a_draw(self) -> None:
+        """64 randbool() calls should share one 8-byte extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for _ in range(64):
+            tap.randbool()
+        assert pool.total_extracted == 8
+
+        tap.randbool()
+        assert pool.total_extracted == 16
+
 
 class TestEntropyTapRandbytes:
     """Test EntropyTap.randbytes() method."""
@@ -172,15 +322,43 @@ class TestEntropyTapRandbytes:
             assert len(result) == n
 
     def test_randbytes_invalid_size_raises(self) -> None:
-        """randbytes() with invalid size should raise."""
+        """randbytes() with a negative size should raise."""
         pool = EntropyPool()
         tap = EntropyTap(pool)
 
         with pytest.raises(ValueError):
-            tap.randbytes(0)
+            tap.randbytes(-1)
+
+    def test_randbytes_zero_skips_pool(self) -> None:
+        """randbytes(0) should return b"" without touching the pool."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        assert tap.randbytes(0) == b""
+        assert pool.total_extracted == 0
+
+    def test_randbytes_into_matches_randbytes(self) -> None:
+        """randbytes_into() should write the bytes randbytes() would return."""
+        tap1 = EntropyTap(EntropyPool(seed=b"into"))
+        tap2 = EntropyTap(EntropyPool(seed=b"into"))
+
+        for n in [1, 16, 32, 100]:
+            buf = bytearray(n)
+            assert tap1.randbytes_into(buf) == n
+            assert bytes(buf) == tap2.randbytes(n)
+
+    def test_randbytes_into_invalid_buffer_raises(self) -> None:
+        """randbytes_into() should reject read-only and empty buffers."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        with pytest.raises(TypeError):
+            tap.randbytes_into(b"read-only")
 
         with pytest.raises(ValueError):
-            tap.randbytes(-1)
+            tap.randbytes_into(bytearray())
+
+        assert pool.total_extracted == 0
 
 
 class TestEntropyTapChoice:
@@ -205,6 +383,8 @@ class TestEntropyTapChoice:
         for _ in range(100):
             assert tap.choice([42]) == 42
 
+        assert pool.total_extracted == 0
+
     def test_choice_empty_raises(self) -> None:
         """choice() with empty sequence should raise IndexError."""
         pool = EntropyPool()
@@ -225,6 +405,17 @@ class TestEntropyTapChoice:
         for item in items:
             assert 800 < counts[item] < 1200
 
+    def test_choice_reads_from_burst(self) -> None:
+        """choice() on short sequences should take single buffered bytes."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for _ in range(40):
+            assert tap.choice("abcdefghij") in "abcdefghij"
+
+        assert pool.total_extracted == EntropyTap.BURST_SIZE
+        assert 0 <= tap.choice(range(10**12)) < 10**12
+
 
 class TestEntropyTapShuffle:
     """Test EntropyTap.shuffle() method."""
@@ -266,6 +457,40 @@ class TestEntropyTapShuffle:
         assert len(items) == 5
         assert set(items) == {"a", "b", "c", "d", "e"}
 
+    def test_shuffle_non_list_sequence(self) -> None:
+        """shuffle() should work on mutable sequences other than list."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        items = bytearray(range(50))
+        tap.shuffle(items)
+
+        assert sorted(items) == list(range(50))
+
+    def test_shuffle_single_pool_extraction(self) -> None:
+        """shuffle() should draw all its entropy in one extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        tap.shuffle(list(range(100)))
+
+        assert pool.total_extracted == 4 * 99
+
+    def test_shuffle_uniform_permutations(self) -> None:
+        """All permutations of 3 elements should be roughly equally likely."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        counts: Counter[tuple[int, ...]] = Counter()
+        for _ in range(6000):
+            items = [0, 1, 2]
+            tap.shuffle(items)
+            counts[tuple(items)] += 1
+
+        assert len(counts) == 6
+        for count in counts.values():
+            assert 800 < count < 1200
+
 
 class TestEntropyTapSample:
     """Test EntropyTap.sample() method."""
@@ -328,6 +553,59 @@ class TestEntropyTapSample:
 
         assert result == []
 
+    def test_sample_sparse_large_population(self) -> None:
+        """Small samples of huge ranges should not build an index list."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        sizes: list[int] = []
+        extract = pool.extract
+
+        def spy(n: int) -> bytes:
+            sizes.append(n)
+            return extract(n)
+
+        pool.extract = spy  # type: ignore[method-assign]
+        result = tap.sample(range(10**9), 5)
+
+        assert len(set(result)) == 5
+        assert all(0 <= x < 10**9 for x in result)
+        # Floyd's selection plus the shuffle of the picks, in one draw.
+        # Only the first draw is checked: for a 10^9 range about 7% of
+        # 32-bit words are rejected as biased, so roughly a third of calls
+        # make further small draws
+        assert sizes[0] == 4 * 9
+
+    def test_sample_sparse_order_is_uniform(self) -> None:
+        """Every position of a sparse sample should be uniformly distributed."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        first: dict[int, int] = {}
+        second: dict[int, int] = {}
+        for _ in range(5000):
+            a, b = tap.sample(range(25), 2)
+            first[a] = first.get(a, 0) + 1
+            second[b] = second.get(b, 0) + 1
+
+        for counts in (first, second):
+            assert len(counts) == 25
+            assert all(120 < c < 280 for c in counts.values())
+
+    def test_base_sample_sparse_path(self) -> None:
+        """BaseTap.sample() should pick uniformly without an index list."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        counts: Counter[int] = Counter()
+        for _ in range(2000):
+            result = BaseTap.sample(tap, range(100), 5)
+            assert len(set(result)) == 5
+            counts.update(result)
+
+        assert len(counts) == 100
+        assert all(50 < c < 150 for c in counts.values())
+
 
 class TestEntropyTapUniform:
     """Test EntropyTap.uniform() method."""
@@ -350,6 +628,28 @@ class TestEntropyTapUniform:
             value = tap.uniform(-10.0, -5.0)
             assert -10.0 <= value <= -5.0
 
+    def test_uniform_huge_range_stays_finite(self) -> None:
+        """uniform() should not overflow when b - a exceeds the float range."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for _ in range(100):
+            value = tap.uniform(-1e308, 1e308)
+            assert -1e308 <= value <= 1e308
+
+    def test_uniform_degenerate_and_narrow_ranges(self) -> None:
+        """uniform() should return a for a == b and stay inside narrow ranges."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for x in (0.1, -3.7, 1e-300, 123456.789):
+            assert all(tap.uniform(x, x) == x for _ in range(200))
+
+        for a in (0.1, 0.3, -2.5, 1e10, 7.0):
+            b = math.nextafter(math.nextafter(a, math.inf), math.inf)
+            for _ in range(500):
+                assert a <= tap.uniform(a, b) <= b
+
 
 class TestEntropyTapGauss:
     """Test EntropyTap.gauss() method."""
@@ -383,3 +683,108 @@ class TestEntropyTapGauss:
         std = math.sqrt(sum((x - mean) ** 2 for x in samples) / len(samples))
 
         assert 1.8 < std < 2.2
+
+    def test_gauss_reuses_second_value_of_pair(self) -> None:
+        """Every other gauss() call should be served without new entropy."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        tap.gauss()
+        extracted = pool.total_extracted
+        tap.gauss()
+
+        assert pool.total_extracted == extracted
+        assert extracted > 0
+
+    def test_gauss_batches_pool_extractions(self) -> None:
+        """Consecutive gauss() calls should share one batched extraction."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        for _ in range(10):
+            tap.gauss()
+
+        assert pool.total_extracted == 2 * 7 * EntropyTap.GAUSS_BATCH
+
+
+def _draws_after_fork_and_reseed(
+    tap: EntropyTap, draw: Callable[[], object], count: int = 8
+) -> tuple[str, str]:
+    """Fork, reseed the pool in both processes, and return each side's draws."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # Child: report its draws through the pipe and exit
+        try:
+            tap._pool.reseed()
+            os.write(write_fd, repr([draw() for _ in range(count)]).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    tap._pool.reseed()
+    parent = repr([draw() for _ in range(count)])
+
+    with os.fdopen(read_fd, "rb") as pipe:
+        child = pipe.read().decode()
+    os.waitpid(pid, 0)
+
+    return parent, child
+
+
+class TestEntropyTapBuffers:
+    """Test that buffered draws never outlive the pool state."""
+
+    def test_feed_discards_buffered_draws(self) -> None:
+        """Buffered draws should be refilled after the pool is fed."""
+        pool = EntropyPool()
+        tap = EntropyTap(pool)
+
+        tap.randint(1, 6)
+        pool.feed(b"new data")
+        tap.randint(1, 6)
+
+        assert pool.total_extracted == 2 * EntropyTap.BURST_SIZE
+
+        tap.randbool()
+        pool.reseed()
+        tap.randbool()
+
+        assert pool.total_extracted == 2 * EntropyTap.BURST_SIZE + 2 * 8
+
+        tap.gauss()
+        before = pool.total_extracted
+        pool.feed(b"more data")
+        tap.gauss()
+
+        assert pool.total_extracted == before + 2 * 7 * EntropyTap.GAUSS_BATCH
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_fork_then_reseed_diverges_randint(self) -> None:
+        """Parent and child should not share buffered randint() bytes."""
+        tap = EntropyTap(EntropyPool())
+        tap.randint(1, 6)
+
+        parent, child = _draws_after_fork_and_reseed(tap, lambda: tap.randint(0, 2**32))
+        assert parent != child
+
+        parent, child = _draws_after_fork_and_reseed(tap, lambda: tap.choice(range(1000)))
+        assert parent != child
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_fork_then_reseed_diverges_randbool(self) -> None:
+        """Parent and child should not share buffered randbool() bits."""
+        tap = EntropyTap(EntropyPool())
+        tap.randbool()
+
+        parent, child = _draws_after_fork_and_reseed(tap, tap.randbool, count=64)
+        assert parent != child
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_fork_then_reseed_diverges_gauss(self) -> None:
+        """Parent and child should not share buffered gauss() normals."""
+        tap = EntropyTap(EntropyPool())
+        tap.gauss()
+
+        parent, child = _draws_after_fork_and_reseed(tap, tap.gauss)
+        assert parent != child